@@ -0,0 +1,95 @@
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(ROOT, "src")
+
+
+def percentile(sorted_values, q):
+    """Linearly interpolated percentile of an already sorted list
+
+    Args:
+        sorted_values: Ascending list of numbers
+        q: Percentile between 0 and 100
+    """
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def classify_response(text):
+    """Classify the text content of a tool response
+
+    Tools report failures as {"success": false} content rather than MCP errors, and
+    admission control sheds requests the same way with an "overloaded" reason.
+
+    Returns:
+        str: "ok", "error" or "shed"
+    """
+    try:
+        body = json.loads(text)
+    except ValueError:
+        return "error"
+    if isinstance(body, dict) and body.get("success") is False:
+        return "shed" if body.get("overloaded") else "error"
+    return "ok"
+
+
+def summarize(latencies, elapsed, errors=0, shed=0):
+    """Summarize request latencies (seconds) measured over elapsed wall-clock seconds
+
+    Returns:
+        dict: count, errors, shed requests, rps of the successful requests and
+            p50/p95/p99/mean/max latency in milliseconds
+    """
+    values = sorted(latencies)
+    count = len(values)
+
+    def ms(value):
+        return round(value * 1000, 3) if value is not None else None
+
+    return {
+        "count": count,
+        "errors": errors,
+        "shed": shed,
+        "rps": round((count - errors - shed) / elapsed, 1) if elapsed > 0 else None,
+        "p50_ms": ms(percentile(values, 50)),
+        "p95_ms": ms(percentile(values, 95)),
+        "p99_ms": ms(percentile(values, 99)),
+        "mean_ms": ms(sum(values) / count) if count else None,
+        "max_ms": ms(values[-1]) if count else None
+    }
+
+
+def run_metadata(**extra):
+    """Describe the environment a benchmark ran in so results can be compared across commits"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        **extra
+    }
+
+
+def write_results(results, output=None):
+    """Write benchmark results as JSON to a file, or to stdout if no file is given"""
+    text = json.dumps(results, indent=2)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        print(f"Results written to {output}", file=sys.stderr)
+    else:
+        print(text)
@@ -0,0 +1,128 @@
+"""In-process microbenchmarks of the Modus MCP tools
+
+Calls every tool through FastMCP's call_tool (argument validation, the tool itself and
+result serialization) without a network or an SSE session:
+
+- get_component_details for every component in db.json and db_ui.json, React and Angular
+- get_components_details for a typical form
+- get_modus_icons_by_char for every first letter and a few longer prefixes
+- search_modus_icons and search_modus for a few representative queries
+- the argument-less tools
+
+Each case runs with a cold response cache (cleared before every call, so the response
+is built) and a warm one (served from the cache). Results are p50/p95/p99 latency and
+calls per second per benchmark, as JSON that compare.py can diff across commits.
+
+Usage:
+    python benchmarks/bench_tools.py --iterations 20 --output results.json
+"""
+import argparse
+import asyncio
+import os
+import string
+import sys
+import time
+from contextlib import redirect_stdout
+
+from bench_common import SRC_DIR, classify_response, run_metadata, summarize, write_results
+
+sys.path.insert(0, SRC_DIR)
+
+FORM_COMPONENTS = ["ModusTextInput", "ModusSelect", "ModusDateInput", "ModusCheckbox", "ModusButton"]
+ICON_PREFIXES = ["", "arrow", "file_type", "calendar", "zz"]
+ICON_QUERIES = ["trash", "gear", "calendar", "arrow left", "warnng"]
+SEARCH_QUERIES = [("date picker", None), ("table sorting", "angular"), ("disabled button", "react"),
+                  ("validation error message", None)]
+
+
+def build_cases(registry):
+    """Get the (benchmark name, tool name, arguments) cases to run"""
+    cases = [
+        ("getting_started_installation_and_guidelines", "getting_started_installation_and_guidelines", {}),
+        ("get_list_of_all_modus_components", "get_list_of_all_modus_components", {}),
+        ("get_knowledge_base_status", "get_knowledge_base_status", {})
+    ]
+    for name in registry.get_all_components():
+        cases.append(("get_component_details[react]", "get_component_details", {"component_name": name}))
+        cases.append(("get_component_details[angular]", "get_component_details",
+                      {"component_name": name, "framework": "angular"}))
+    for framework in ("react", "angular"):
+        cases.append((f"get_components_details[{framework}]", "get_components_details",
+                      {"component_names": FORM_COMPONENTS, "framework": framework}))
+    for prefix in list(string.ascii_lowercase) + ICON_PREFIXES:
+        cases.append(("get_modus_icons_by_char", "get_modus_icons_by_char", {"char_prefix": prefix}))
+    for query in ICON_QUERIES:
+        cases.append(("search_modus_icons", "search_modus_icons", {"query": query}))
+    for query, framework in SEARCH_QUERIES:
+        arguments = {"query": query}
+        if framework:
+            arguments["framework"] = framework
+        cases.append(("search_modus", "search_modus", arguments))
+    return cases
+
+
+async def run_cases(server, cases, iterations, cold):
+    """Call every case `iterations` times and group the latencies by benchmark name"""
+    latencies = {}
+    elapsed = {}
+    outcomes = {"error": {}, "shed": {}}
+    for _ in range(iterations):
+        for name, tool, arguments in cases:
+            if cold:
+                server.response_cache.clear()
+            start = time.perf_counter()
+            try:
+                content = await server.mcp.call_tool(tool, arguments)
+                outcome = classify_response(content[0].text)
+            except Exception:
+                outcome = "error"
+            duration = time.perf_counter() - start
+            if outcome != "ok":
+                outcomes[outcome][name] = outcomes[outcome].get(name, 0) + 1
+            latencies.setdefault(name, []).append(duration)
+            elapsed[name] = elapsed.get(name, 0.0) + duration
+    return {name: summarize(values, elapsed[name], outcomes["error"].get(name, 0), outcomes["shed"].get(name, 0))
+            for name, values in latencies.items()}
+
+
+async def run(args):
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        start = time.perf_counter()
+        import ModusFromMCP as server
+        startup_ms = round((time.perf_counter() - start) * 1000, 1)
+        server.registry.warm_up()
+
+        cases = build_cases(server.registry)
+        results = {}
+        for mode in args.modes:
+            for name, stats in (await run_cases(server, cases, args.iterations, mode == "cold")).items():
+                results[f"{name}:{mode}"] = stats
+        server.work_pool.shutdown()
+
+    return {
+        "meta": run_metadata(
+            benchmark="tools",
+            iterations=args.iterations,
+            import_ms=startup_ms,
+            index_source=server.registry.get_index_status()["source"]
+        ),
+        "results": results
+    }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Microbenchmark the Modus MCP tools in-process")
+    parser.add_argument("--iterations", type=int, default=20, help="Passes over every case (default: 20)")
+    parser.add_argument("--modes", nargs="+", choices=("cold", "warm"), default=["cold", "warm"],
+                        help="Response cache modes to run (default: both)")
+    parser.add_argument("--output", help="Write the JSON results to this file instead of stdout")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    write_results(asyncio.run(run(args)), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Compare two benchmark result files written by bench_tools.py or load_sse.py
+
+Prints p50/p95/p99 and RPS of every benchmark in both files with the relative change,
+and exits with 1 if any p95 regressed by more than --threshold percent.
+
+Usage:
+    python benchmarks/compare.py baseline.json candidate.json --threshold 10
+"""
+import argparse
+import json
+import sys
+
+METRICS = ("p50_ms", "p95_ms", "p99_ms", "rps")
+
+
+def change(old, new):
+    """Relative change from old to new in percent, or None if it cannot be computed"""
+    if old in (None, 0) or new is None:
+        return None
+    return (new - old) / old * 100
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two Modus benchmark result files")
+    parser.add_argument("baseline", help="Results of the reference commit")
+    parser.add_argument("candidate", help="Results to compare against the baseline")
+    parser.add_argument("--threshold", type=float, default=10,
+                        help="Fail when a p95 latency grows by more than this percentage (default: 10)")
+    args = parser.parse_args()
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(args.candidate, encoding="utf-8") as f:
+        candidate = json.load(f)
+
+    print(f"baseline {baseline['meta'].get('commit')} vs candidate {candidate['meta'].get('commit')}")
+    print(f"{'benchmark':<55}" + "".join(f" {metric:>26}" for metric in METRICS))
+    regressions = []
+    for name, new in candidate["results"].items():
+        old = baseline["results"].get(name)
+        if old is None:
+            print(f"{name:<55} (new)")
+            continue
+        cells = []
+        for metric in METRICS:
+            delta = change(old[metric], new[metric])
+            cells.append(f"{old[metric]} -> {new[metric]}" + (f" ({delta:+.0f}%)" if delta is not None else ""))
+        print(f"{name:<55}" + "".join(f" {cell:>26}" for cell in cells))
+        delta = change(old["p95_ms"], new["p95_ms"])
+        if delta is not None and delta > args.threshold:
+            regressions.append(name)
+
+    if regressions:
+        print(f"p95 regressed by more than {args.threshold}%: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
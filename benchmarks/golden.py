@@ -0,0 +1,320 @@
+"""Golden-output regression harness for the ComponentRegistry lookup paths
+
+Walks every component in db.json and db_ui.json for React and Angular (plus the
+component list, the guidelines and the icon lookups), snapshots the outputs as golden
+files in benchmarks/golden/ and checks that every lookup path still returns them:
+
+- live: ComponentRegistry parsing the Knowledge Base files
+- index_store: ComponentRegistry memory-mapping a prebuilt index file
+- reference: the original file-scanning ComponentRegistry, loaded from a git revision
+  (--reference)
+- reference_header_fix: the same with its '# <Name>' section marker corrected to the
+  '#<Name>' the knowledge bases use, which isolates the remaining differences
+
+Intended differences of a path from the golden outputs are listed in KNOWN_DIFFERENCES;
+any other difference fails the check.
+
+Every path is also timed over the full set of cases; with a reference, the speedup of
+each path over the reference is reported per lookup group.
+
+Usage:
+    python benchmarks/golden.py --update                  # snapshot the current outputs
+    python benchmarks/golden.py                           # check the live and index_store paths
+    python benchmarks/golden.py --reference <revision> --output golden.json
+
+The reference revision is any commit before the indexing work, e.g. the first commit
+of the registry: git log --reverse --format=%h -- src/modules/component_registry.py | head -1
+"""
+import argparse
+import io
+import json
+import os
+import string
+import subprocess
+import sys
+import tempfile
+import time
+import types
+from contextlib import redirect_stdout
+
+from bench_common import ROOT, SRC_DIR, run_metadata, write_results
+
+sys.path.insert(0, SRC_DIR)
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden")
+FRAMEWORKS = (None, "angular")
+ICON_PREFIXES = list(string.ascii_lowercase) + ["arrow", "file_type", "zz"]
+
+
+def _details_group(framework):
+    return f"details_{framework or 'react'}"
+
+
+def _examples_differ(group, expected, actual):
+    """True if two details responses differ in their examples only"""
+    if not group.startswith("details_"):
+        return False
+    strip = lambda response: {key: value for key, value in response.items() if key != "examples"}
+    return expected.get("examples") != actual.get("examples") and strip(expected) == strip(actual)
+
+
+# Differences from the golden outputs that are intended, per path. Each entry matches
+# the cases it explains; anything else that differs fails the check.
+KNOWN_DIFFERENCES = [
+    {
+        "id": "kb-header-marker",
+        "paths": ("reference",),
+        "description": "The original code looked sections up by a '# <Name>' header while the knowledge "
+                       "bases use '#<Name>', so it returned no examples for any component",
+        "matches": lambda group, name, expected, actual: (
+            _examples_differ(group, expected, actual) and actual.get("examples") == []
+        )
+    },
+    {
+        "id": "kb-bare-header",
+        "paths": ("reference_header_fix",),
+        "description": "From_KB.md introduces ModusRadioGroup with a bare '# ModusRadioGroup' header: the "
+                       "original code found no RadioGroup examples and appended them to ModusTextInput's",
+        "matches": lambda group, name, expected, actual: (
+            group == "details_react" and name in ("ModusRadioGroup", "ModusTextInput")
+            and _examples_differ(group, expected, actual)
+        )
+    },
+    {
+        "id": "kb-repeated-header",
+        "paths": ("reference_header_fix",),
+        "description": "UI_KB.md repeats the '#<ModusTable>' header: the original code stopped at the "
+                       "second header and returned no examples, the sections are now merged",
+        "matches": lambda group, name, expected, actual: (
+            group == "details_react" and name == "ModusTable" and _examples_differ(group, expected, actual)
+        )
+    }
+]
+
+
+class CurrentPath:
+    """Lookups through today's ComponentRegistry"""
+
+    def __init__(self, registry):
+        self.registry = registry
+
+    def components(self):
+        return self.registry.get_all_components()
+
+    def details(self, component_name, framework):
+        details = self.registry.get_component_details(component_name, framework)
+        if details is None:
+            return {"success": False, "error": f"Component {component_name} not found in component registry"}
+        return {"success": True, **details}
+
+    def guidelines(self):
+        return self.registry.get_installation_guidelines()
+
+    def icons(self):
+        return self.registry.get_all_icon_names()
+
+    def icons_by_char(self, prefix):
+        return self.registry.search_icons_by_prefix(prefix)[0]
+
+
+class ReferencePath:
+    """Lookups through the original ComponentRegistry, assembled like the original tools"""
+
+    def __init__(self, registry):
+        self.registry = registry
+
+    def _call(self, method, *args):
+        # The original registry prints on every lookup
+        with redirect_stdout(io.StringIO()):
+            return getattr(self.registry, method)(*args)
+
+    def components(self):
+        return self._call("get_all_components")
+
+    def details(self, component_name, framework):
+        info = self._call("get_component_properties_and_events", component_name)
+        if not info["properties"]:
+            return {"success": False, "error": f"Component {component_name} not found in component registry"}
+        angular = framework and framework.lower() == "angular"
+        examples = self._call("_extract_kb_examples", None, component_name, "angular" if angular else None)
+        return {
+            "success": True,
+            "component": component_name,
+            "description": info["description"],
+            "properties": info["properties"],
+            "events": info["events"],
+            "methods": info["methods"],
+            "examples": examples,
+            "framework": framework or "React"
+        }
+
+    def guidelines(self):
+        return self._call("get_installation_guidelines")
+
+    def icons(self):
+        return self._call("get_all_icon_names")
+
+    def icons_by_char(self, prefix):
+        if not prefix:
+            return self._call("get_all_icon_names")
+        return self._call("get_icon_names_by_char", prefix)
+
+
+def load_reference_registry(revision, fix_header_marker=False):
+    """Load ComponentRegistry as it was at a git revision
+
+    The module is executed with today's __file__ so that it finds the Knowledge Base.
+
+    Args:
+        revision: Git revision to load src/modules/component_registry.py from
+        fix_header_marker: Look sections up by '#<Name>' instead of '# <Name>'
+    """
+    path = os.path.join(SRC_DIR, "modules", "component_registry.py")
+    source = subprocess.run(["git", "show", f"{revision}:src/modules/component_registry.py"], cwd=ROOT,
+                            capture_output=True, text=True, check=True).stdout
+    if fix_header_marker:
+        source = source.replace('"# <', '"#<')
+    module = types.ModuleType(f"component_registry_{revision}")
+    module.__file__ = path
+    exec(compile(source, path, "exec"), module.__dict__)
+    return module.ComponentRegistry()
+
+
+def build_cases(component_names):
+    """Get the (group, case name, call) cases; call takes a path and returns the output"""
+    cases = [("components", "components", lambda path: path.components()),
+             ("guidelines", "guidelines", lambda path: path.guidelines()),
+             ("icons", "icons", lambda path: path.icons())]
+    for framework in FRAMEWORKS:
+        for name in dict.fromkeys(component_names):
+            cases.append((_details_group(framework), name,
+                          lambda path, name=name, framework=framework: path.details(name, framework)))
+    for prefix in ICON_PREFIXES:
+        cases.append(("icons_by_char", prefix, lambda path, prefix=prefix: path.icons_by_char(prefix)))
+    return cases
+
+
+def run_path(path, cases, repeat):
+    """Run every case on a path
+
+    Returns:
+        tuple: (group -> {case name: output}, group -> best total seconds over `repeat` runs)
+    """
+    outputs = {}
+    timings = {}
+    for run in range(repeat):
+        totals = {}
+        for group, name, call in cases:
+            start = time.perf_counter()
+            output = call(path)
+            totals[group] = totals.get(group, 0.0) + time.perf_counter() - start
+            if run == 0:
+                # Compare the JSON form, which is what clients receive
+                outputs.setdefault(group, {})[name] = json.loads(json.dumps(output))
+        for group, seconds in totals.items():
+            timings[group] = min(timings.get(group, seconds), seconds)
+    return outputs, timings
+
+
+def compare(path_name, golden, outputs):
+    """Compare a path's outputs with the golden ones
+
+    Returns:
+        dict: Counts of identical, documented and undocumented differences, with the
+            documented ones grouped by KNOWN_DIFFERENCES id and the others listed
+    """
+    result = {"identical": 0, "documented": {}, "undocumented": []}
+    for group, expected_cases in golden.items():
+        actual_cases = outputs.get(group, {})
+        for name, expected in expected_cases.items():
+            actual = actual_cases.get(name)
+            if actual == expected:
+                result["identical"] += 1
+                continue
+            known = next((difference for difference in KNOWN_DIFFERENCES
+                          if path_name in difference["paths"] and isinstance(expected, dict)
+                          and isinstance(actual, dict) and difference["matches"](group, name, expected, actual)),
+                         None)
+            if known:
+                result["documented"][known["id"]] = result["documented"].get(known["id"], 0) + 1
+            else:
+                result["undocumented"].append(f"{group}/{name}")
+    return result
+
+
+def read_golden():
+    golden = {}
+    for file_name in sorted(os.listdir(GOLDEN_DIR)):
+        if file_name.endswith(".json"):
+            with open(os.path.join(GOLDEN_DIR, file_name), encoding="utf-8") as f:
+                golden[file_name[:-len(".json")]] = json.load(f)
+    return golden
+
+
+def write_golden(outputs):
+    os.makedirs(GOLDEN_DIR, exist_ok=True)
+    for group, cases in outputs.items():
+        with open(os.path.join(GOLDEN_DIR, f"{group}.json"), "w", encoding="utf-8") as f:
+            json.dump(cases, f, indent=1, ensure_ascii=False)
+            f.write("\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the ComponentRegistry lookup paths against golden outputs")
+    parser.add_argument("--update", action="store_true",
+                        help="Snapshot the live path's outputs as the new golden files")
+    parser.add_argument("--reference", help="Git revision before the indexing work to compare and time against")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing runs per path, the best one counts")
+    parser.add_argument("--output", help="Write the results as JSON to this file (default: stdout)")
+    args = parser.parse_args()
+
+    from modules.component_registry import ComponentRegistry
+    from modules.structured_log import configure_logging
+    configure_logging(level="WARNING", log_format="text")
+
+    live = ComponentRegistry(use_artifact=False)
+    cases = build_cases(live.get_all_components())
+    if args.update:
+        outputs, _ = run_path(CurrentPath(live), cases, 1)
+        write_golden(outputs)
+        print(f"Golden outputs of {len(cases)} cases written to {GOLDEN_DIR}", file=sys.stderr)
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index_path = os.path.join(tmp, "modus_index.bin")
+        live.export_index_store(index_path)
+        paths = {"live": CurrentPath(live), "index_store": CurrentPath(ComponentRegistry(index_path=index_path))}
+        if args.reference:
+            paths["reference"] = ReferencePath(load_reference_registry(args.reference))
+            paths["reference_header_fix"] = ReferencePath(load_reference_registry(args.reference, True))
+
+        golden = read_golden()
+        results = {}
+        timings = {}
+        for path_name, path in paths.items():
+            outputs, timings[path_name] = run_path(path, cases, args.repeat)
+            results[path_name] = compare(path_name, golden, outputs)
+
+    failed = False
+    for path_name, result in results.items():
+        documented = ", ".join(f"{key}: {count}" for key, count in result["documented"].items()) or "none"
+        print(f"{path_name}: {result['identical']} identical, documented differences: {documented}, "
+              f"{len(result['undocumented'])} undocumented", file=sys.stderr)
+        for case in result["undocumented"]:
+            print(f"  differs: {case}", file=sys.stderr)
+        failed = failed or bool(result["undocumented"])
+        result["seconds"] = {group: round(seconds, 6) for group, seconds in timings[path_name].items()}
+        if "reference" in timings:
+            result["speedup"] = {group: round(timings["reference"][group] / seconds, 1) if seconds else None
+                                 for group, seconds in timings[path_name].items()}
+
+    write_results({
+        "meta": run_metadata(reference=args.reference, repeat=args.repeat, cases=len(cases)),
+        "documented_differences": {difference["id"]: difference["description"] for difference in KNOWN_DIFFERENCES},
+        "paths": results
+    }, args.output)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+"""SSE load generator for the Modus MCP server
+
+Drives the real server over the MCP SSE transport with concurrent simulated agents.
+Each agent opens its own session and repeats a typical agent workflow until the run
+ends: list the components, fetch the details of a few random components for React or
+Angular, batch-fetch a form's components, look up icons and run a full-text search.
+
+Results are p50/p95/p99 latency per tool and overall, and requests per second over the
+wall-clock duration of the run, as JSON that compare.py can diff across commits.
+
+Usage:
+    python benchmarks/load_sse.py --spawn --agents 20 --duration 30 --output load.json
+    python benchmarks/load_sse.py --url http://localhost:3001/sse --agents 50
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import string
+import subprocess
+import sys
+import time
+from urllib.parse import urlparse
+
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+
+from bench_common import SRC_DIR, classify_response, run_metadata, summarize, write_results
+
+ICON_QUERIES = ["trash", "gear", "calendar", "arrow left", "warning", "user", "download"]
+SEARCH_QUERIES = ["date picker", "table sorting", "disabled button", "validation error message",
+                  "dropdown options", "modal dialog"]
+
+
+def workflow(rng, components):
+    """Get the (tool, arguments) calls of one pass of a simulated agent"""
+    framework = rng.choice(("react", "angular"))
+    calls = [("get_list_of_all_modus_components", {})]
+    for name in rng.sample(components, min(3, len(components))):
+        calls.append(("get_component_details", {"component_name": name, "framework": framework}))
+    calls.append(("get_components_details",
+                  {"component_names": rng.sample(components, min(3, len(components))), "framework": framework}))
+    calls.append(("get_modus_icons_by_char", {"char_prefix": rng.choice(string.ascii_lowercase)}))
+    calls.append(("search_modus_icons", {"query": rng.choice(ICON_QUERIES)}))
+    calls.append(("search_modus", {"query": rng.choice(SEARCH_QUERIES), "framework": framework}))
+    return calls
+
+
+async def run_agent(url, seed, deadline, latencies, failures):
+    """Run one simulated agent session until the deadline"""
+    rng = random.Random(seed)
+    async with sse_client(url) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            result = await session.call_tool("get_list_of_all_modus_components", {})
+            components = json.loads(result.content[0].text)["components"]
+            while time.perf_counter() < deadline:
+                for tool, arguments in workflow(rng, components):
+                    start = time.perf_counter()
+                    try:
+                        result = await session.call_tool(tool, arguments)
+                        outcome = "error" if result.isError else classify_response(result.content[0].text)
+                    except Exception:
+                        outcome = "error"
+                    latencies.setdefault(tool, []).append(time.perf_counter() - start)
+                    if outcome != "ok":
+                        failures[outcome][tool] = failures[outcome].get(tool, 0) + 1
+
+
+async def wait_for_port(host, port, timeout):
+    """Wait until a TCP connection to host:port succeeds"""
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+            writer.close()
+            return
+        except OSError:
+            if time.perf_counter() > deadline:
+                raise TimeoutError(f"Server on {host}:{port} did not start within {timeout}s")
+            await asyncio.sleep(0.1)
+
+
+async def run(args):
+    address = urlparse(args.url)
+    server = None
+    if args.spawn:
+        env = dict(os.environ, MODUS_PORT=str(address.port or 80), MODUS_KB_RELOAD_INTERVAL="0")
+        # Agents call as fast as they can; measure throughput rather than the per-session limit
+        env.setdefault("MODUS_RATE_LIMIT", "0")
+        server = subprocess.Popen([sys.executable, os.path.join(SRC_DIR, "ModusFromMCP.py")], env=env,
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        await wait_for_port(address.hostname, address.port or 80, args.startup_timeout)
+        latencies = {}
+        failures = {"error": {}, "shed": {}}
+        start = time.perf_counter()
+        outcomes = await asyncio.gather(*(
+            run_agent(args.url, args.seed + agent, start + args.duration, latencies, failures)
+            for agent in range(args.agents)
+        ), return_exceptions=True)
+        elapsed = time.perf_counter() - start
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+
+    errors, shed = failures["error"], failures["shed"]
+    results = {tool: summarize(values, elapsed, errors.get(tool, 0), shed.get(tool, 0))
+               for tool, values in sorted(latencies.items())}
+    results["overall"] = summarize([value for values in latencies.values() for value in values], elapsed,
+                                   sum(errors.values()), sum(shed.values()))
+    return {
+        "meta": run_metadata(
+            benchmark="load_sse",
+            url=args.url,
+            agents=args.agents,
+            duration_s=args.duration,
+            seed=args.seed,
+            failed_sessions=[repr(outcome) for outcome in outcomes if isinstance(outcome, Exception)]
+        ),
+        "results": results
+    }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Load test the Modus MCP server over SSE")
+    parser.add_argument("--url", default="http://localhost:3001/sse", help="SSE endpoint of the server")
+    parser.add_argument("--agents", type=int, default=10, help="Concurrent simulated agents (default: 10)")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds to run (default: 30)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed of the agent workflows")
+    parser.add_argument("--spawn", action="store_true", help="Start a local server on the port of --url")
+    parser.add_argument("--startup-timeout", type=float, default=30,
+                        help="Seconds to wait for the server to accept connections")
+    parser.add_argument("--output", help="Write the JSON results to this file instead of stdout")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    write_results(asyncio.run(run(args)), args.output)
+
+
+if __name__ == "__main__":
+    main()
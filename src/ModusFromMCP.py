@@ -1,8 +1,35 @@
+import time
+
+# Boot timings are measured from here, before the FastMCP stack is imported
+STARTED_AT = time.perf_counter()
+
 from mcp.server.fastmcp import FastMCP
-from modules.component_registry import ComponentRegistry
+from starlette.responses import PlainTextResponse
+from modules.admission import AdmissionController
+from modules.component_registry import OUTPUT_FORMATS, ComponentRegistry
+from modules.concurrency import SingleFlight, WorkPool
+from modules.kb_watcher import KnowledgeBaseWatcher
+from modules.metrics import ToolMetrics
+from modules.response_cache import ResponseCache, content_etag
+from modules.structured_log import configure_logging, get_logger
+import asyncio
+import json
+import pydantic_core
 import sys
 import os
-import json
+
+# Leveled, rate-limited structured logs (MODUS_LOG_LEVEL, MODUS_LOG_FORMAT, MODUS_LOG_RATE)
+log_rate_limit = configure_logging()
+logger = get_logger("server")
+
+def _elapsed_ms(since=STARTED_AT):
+    return round((time.perf_counter() - since) * 1000, 1)
+
+# Milliseconds since STARTED_AT at each boot milestone, reported by get_knowledge_base_status
+boot_timings = {"imports_ms": _elapsed_ms()}
+
+# Port to listen on; the multi-worker launcher gives each worker its own port
+port = int(os.environ.get("MODUS_PORT", "3001"))
 
 # Instantiate MCP server
 mcp = FastMCP(
@@ -10,146 +37,644 @@ mcp = FastMCP(
     description="An MCP server providing information about Modus React form and UI components",
     version="1.0.0",
     transport="sse",
-    port=3001,
+    port=port,
     allow_origins=["*"]
 )
 
-# Initialize component registry
-registry = ComponentRegistry()
+# Initialize component registry. With MODUS_INDEX_PATH set (multi-worker mode) the
+# registry memory-maps that prebuilt index file instead of parsing the Knowledge Base.
+registry = ComponentRegistry(index_path=os.environ.get("MODUS_INDEX_PATH"))
+boot_timings["registry_ms"] = _elapsed_ms()
+
+# Poll the Knowledge Base directory (or the prebuilt index file) so content edits go
+# live without a restart (MODUS_KB_RELOAD_INTERVAL seconds between polls, 0 disables)
+if registry.index_path:
+    kb_watcher = KnowledgeBaseWatcher(
+        os.path.dirname(registry.index_path),
+        registry.reload,
+        interval=float(os.environ.get("MODUS_KB_RELOAD_INTERVAL", "2")),
+        patterns=(os.path.basename(registry.index_path),)
+    )
+else:
+    kb_watcher = KnowledgeBaseWatcher(
+        registry.kb_dir,
+        registry.reload,
+        interval=float(os.environ.get("MODUS_KB_RELOAD_INTERVAL", "2"))
+    )
+
+# Built responses keyed by (tool, normalized args, KB generation); a KB reload
+# invalidates them. MODUS_RESPONSE_CACHE_SIZE bounds the parameterized entries.
+response_cache = ResponseCache(max_entries=int(os.environ.get("MODUS_RESPONSE_CACHE_SIZE", "512")))
+
+# Cache misses are built in a bounded thread pool so the event loop keeps serving
+# other SSE clients; concurrent identical requests share one in-flight build.
+work_pool = WorkPool(max_workers=int(os.environ.get("MODUS_WORKER_THREADS", "4")))
+single_flight = SingleFlight()
+
+# Call count, latency histogram, errors and response bytes of every tool
+tool_metrics = ToolMetrics()
+
+def _response_size(result):
+    """Size in bytes of the text FastMCP sends for a tool result
+
+    Strings are sent as they are, anything else as indented JSON.
+    """
+    if isinstance(result, str):
+        return len(result.encode("utf-8"))
+    return len(pydantic_core.to_json(result, fallback=str, indent=2))
+
+def _is_error(result):
+    return isinstance(result, dict) and result.get("success") is False
+
+instrumented = tool_metrics.instrument(_response_size, _is_error)
+
+# Per-session token buckets (MODUS_RATE_LIMIT requests/s, MODUS_RATE_BURST) and a global
+# cap of MODUS_MAX_IN_FLIGHT requests with up to MODUS_MAX_QUEUE waiting for
+# MODUS_QUEUE_TIMEOUT seconds; anything beyond is rejected with a retry-after hint
+admission = AdmissionController(
+    rate=float(os.environ.get("MODUS_RATE_LIMIT", "20")),
+    burst=int(os.environ.get("MODUS_RATE_BURST", "40")),
+    max_in_flight=int(os.environ.get("MODUS_MAX_IN_FLIGHT", "16")),
+    max_queue=int(os.environ.get("MODUS_MAX_QUEUE", "64")),
+    queue_timeout=float(os.environ.get("MODUS_QUEUE_TIMEOUT", "2"))
+)
+
+def _current_session():
+    """The MCP session of the request being handled, None outside a request"""
+    try:
+        return mcp.get_context().session
+    except (LookupError, ValueError):
+        return None
+
+def _overloaded(error):
+    """Fast rejection of a shed request"""
+    retry_after = round(max(error.retry_after, 0.01), 2)
+    logger.debug("Request shed", reason=error.reason, retry_after=retry_after)
+    return {
+        "success": False,
+        "error": f"Server is overloaded ({error.reason}), retry after {retry_after} s",
+        "overloaded": error.reason,
+        "retry_after": retry_after
+    }
+
+admitted = admission.guard(_current_session, _overloaded)
+
+def _succeeded(result):
+    """Only successful responses are cached"""
+    return result.get("success", False)
+
+async def _respond(tool, args, build, pinned=False, cacheable=_succeeded, etag=False):
+    """Serve a tool response from the cache, building it off the event loop on a miss
+
+    Args:
+        tool: Tool name
+        args: Hashable tuple of normalized arguments
+        build: Blocking zero-argument callable producing the response
+        pinned: Keep the cached response outside the LRU
+        cacheable: Predicate deciding whether a built response is cached
+        etag: Add a content-addressed "etag" to successful responses when they are built
+
+    Returns:
+        dict: The tool response
+    """
+    generation = registry.generation
+    response = response_cache.get(tool, args, generation)
+    if response is not None:
+        return response
+
+    def build_response():
+        response = build()
+        if etag and response.get("success", True):
+            response["etag"] = content_etag(response)
+        return response
+
+    async def compute():
+        response = await work_pool.run(build_response)
+        if cacheable is None or cacheable(response):
+            response_cache.put(tool, args, generation, response, pinned=pinned)
+        return response
+
+    return await single_flight.do((tool, args, generation), compute)
+
+def _component_not_found(component_name, message="not found in component registry", framework=None):
+    """Error response for an unknown component name, with "did you mean" suggestions
+
+    With a framework, suggestions come from that framework's knowledge base sections.
+    """
+    suggestions = registry.suggest_component_names(component_name, framework=framework)
+    error_msg = f"Component {component_name} {message}"
+    if suggestions:
+        error_msg += f". Did you mean: {', '.join(suggestions)}?"
+    return {"success": False, "error": error_msg, "suggestions": suggestions}
+
+def _unknown_format(output_format):
+    """Error response for a format outside OUTPUT_FORMATS, or None if the format is valid"""
+    if output_format is None or output_format in OUTPUT_FORMATS:
+        return None
+    return {"success": False,
+            "error": f"Unknown format: {output_format}. Valid formats are: {', '.join(OUTPUT_FORMATS)}"}
+
+def _encoded(response):
+    """A format="compact" response as JSON without indentation, any other response as is
+
+    FastMCP sends a string result verbatim, while it indents the JSON of any other result.
+    """
+    if response.get("format") == "compact":
+        return json.dumps(response, ensure_ascii=False, separators=(",", ":"))
+    return response
+
+def _not_modified(response, if_none_match):
+    """Replace a response by a short not-modified reply if the client already has its ETag"""
+    if if_none_match and response.get("etag") == if_none_match:
+        return {"success": True, "not_modified": True, "etag": if_none_match}
+    return response
 
 # Tool 1: Return guidelines for getting started
 @mcp.tool()
-def getting_started_installation_and_guidelines():
-    """Get guidelines for installation and usage of Modus components"""
+@instrumented
+@admitted
+async def getting_started_installation_and_guidelines(if_none_match: str = None):
+    """Get guidelines for installation and usage of Modus components
+
+    The response carries an "etag"; pass it back as `if_none_match` to get a short
+    {"not_modified": true} reply while the guidelines are unchanged.
+    """
     try:
-        guidelines = registry.get_installation_guidelines()
-        return {"success": True, "guidelines": guidelines}
+        response = await _respond(
+            "getting_started_installation_and_guidelines", (),
+            lambda: {"success": True, "guidelines": registry.get_installation_guidelines()},
+            pinned=True, etag=True
+        )
+        return _not_modified(response, if_none_match)
     except Exception as e:
-        print(f"Error in getting_started_installation_and_guidelines: {str(e)}")
+        logger.exception("Tool failed", tool="getting_started_installation_and_guidelines")
         return {"success": False, "error": str(e)}
 
 # Tool 2: List all Modus components
 @mcp.tool()
-def get_list_of_all_modus_components():
-    """Get a list of all available Modus components (both form and UI)"""
+@instrumented
+@admitted
+async def get_list_of_all_modus_components(if_none_match: str = None, format: str = None):
+    """Get a list of all available Modus components (both form and UI)
+
+    The response carries an "etag"; pass it back as `if_none_match` to get a short
+    {"not_modified": true} reply while the list is unchanged.
+
+    format="compact" lists each component once without the common "Modus" prefix
+    (every tool accepts the names without it).
+    """
     try:
-        components = registry.get_all_components()
-        return {"success": True, "components": components}
+        error = _unknown_format(format)
+        if error:
+            return error
+
+        def build():
+            components = registry.get_all_components()
+            if format != "compact":
+                return {"success": True, "components": components}
+            return {
+                "success": True,
+                "format": "compact",
+                "prefix": "Modus",
+                "components": [name[len("Modus"):] if name.startswith("Modus") else name
+                               for name in dict.fromkeys(components)]
+            }
+
+        response = await _respond(
+            "get_list_of_all_modus_components", (format == "compact",), build,
+            pinned=True, etag=True
+        )
+        return _encoded(_not_modified(response, if_none_match))
     except Exception as e:
-        print(f"Error in get_list_of_all_modus_components: {str(e)}")
+        logger.exception("Tool failed", tool="get_list_of_all_modus_components")
         return {"success": False, "error": str(e)}
 
 # Tool 3: Get details for a specific component
 @mcp.tool()
-def get_component_details(component_name: str, framework: str = None):
-    """Get properties and usage examples for a specific Modus component"""
+@instrumented
+@admitted
+async def get_component_details(component_name: str, framework: str = None, fields: list[str] = None,
+                          max_examples: int = None, include_code: bool = True,
+                          include_questions: bool = True, page_size: int = None,
+                          cursor: str = None, if_none_match: str = None, format: str = None):
+    """Get properties and usage examples for a specific Modus component
+
+    Optional size controls: `fields` limits the response to any of "description",
+    "properties", "events", "methods" and "examples"; `max_examples` caps the number
+    of examples; `include_code` / `include_questions` drop the code or the question
+    text from each example.
+
+    Components with many examples (especially Angular) can be fetched page by page:
+    pass `page_size` to get the properties and the first examples quickly, then call
+    again with the same component, framework and example options and the returned
+    `next_cursor` as `cursor` for the next examples until `next_cursor` is null.
+
+    The response carries an "etag" computed from its content, so it only changes when
+    this component's details or examples change; pass it back as `if_none_match` to
+    get a short {"not_modified": true} reply while a cached copy is still current.
+
+    Component names are matched case-insensitively, with or without the "Modus" prefix
+    and as Angular tags ("checkbox", "ModusCheckBox" and "modus-checkbox" all find
+    ModusCheckbox); unknown names get "did you mean" suggestions.
+
+    format="compact" returns a token-efficient encoding: properties, events, methods
+    and examples as tables ({"columns": [...], "rows": [[...], ...]}), type strings as
+    indexes into a shared "types" list, and example code without indentation.
+    """
     try:
-        print(f"Fetching details for component: {component_name} (Framework: {framework or 'React'})")
+        logger.debug("Fetching component details", component=component_name, framework=framework or "React")
         
-        # Get component properties from registry
-        component_info = registry.get_component_properties_and_events(component_name)
+        def build():
+            # Get properties and framework-specific examples from a single index snapshot
+            try:
+                details = registry.get_component_details(
+                    component_name,
+                    framework,
+                    fields=fields,
+                    max_examples=max_examples,
+                    include_code=include_code,
+                    include_questions=include_questions,
+                    page_size=page_size,
+                    cursor=cursor,
+                    output_format=format
+                )
+            except ValueError as e:
+                return {"success": False, "error": str(e)}
+            if details is None:
+                logger.debug("Component not found", component=component_name)
+                return _component_not_found(component_name)
+            return {"success": True, **details}
         
-        if not component_info["properties"]:
-            error_msg = f"Component {component_name} not found in component registry"
-            print(error_msg)
-            return {"success": False, "error": error_msg}
-        
-        # Get examples using the registry method with framework-specific examples
-        kb = get_knowledge_base()
-        examples = []
-        if kb and kb["content"]:
-            if framework and framework.lower() == "angular":
-                # Extract Angular-specific examples
-                examples = registry._extract_kb_examples(kb["content"], component_name, framework="angular")
-            else:
-                # Default to React examples
-                examples = registry._extract_kb_examples(kb["content"], component_name)
+        # Spellings of the same component share one cache entry
+        component_name = registry.resolve_component_name(component_name) or component_name
+        args = (component_name, framework, tuple(fields) if fields is not None else None,
+                max_examples, include_code, include_questions, page_size, cursor, format)
+        response = await _respond("get_component_details", args, build, etag=True)
+        return _encoded(_not_modified(response, if_none_match))
+    except Exception as e:
+        logger.exception("Tool failed", tool="get_component_details")
+        return {"success": False, "error": str(e)}
+
+# Tool 3b: Get details for several components in one call
+@mcp.tool()
+@instrumented
+@admitted
+async def get_components_details(component_names: list[str], framework: str = None):
+    """Get properties and usage examples for several Modus components in one call
+
+    Use this instead of calling get_component_details repeatedly (e.g. when building a
+    form from TextInput, Select, DateInput, Checkbox and Button). Property definitions
+    shared by several of the components are returned once in "shared_properties" and
+    referenced by name from each component's "shared_properties" list.
+    """
+    try:
+        if not component_names:
+            return {"success": False, "error": "component_names must name at least one component"}
+        logger.debug("Fetching details of several components", count=len(component_names),
+                     framework=framework or "React")
         
-        result = {
-            "success": True,
-            "component": component_name,
-            "description": component_info["description"],
-            "properties": component_info["properties"],
-            "events": component_info["events"],
-            "methods": component_info["methods"],
-            "examples": examples,
-            "framework": framework or "React"
-        }
+        # Spellings of the same components share one cache entry
+        component_names = registry.resolve_component_names(component_names)
+
+        def build():
+            details = registry.get_components_details(component_names, framework)
+            if not details["components"]:
+                return {"success": False, "error": "None of the components were found in component registry: "
+                                                   f"{', '.join(details['not_found'])}"}
+            return {"success": True, **details}
         
-        print(f"Successfully fetched details for {component_name} ({framework or 'React'})")
-        return result
+        return await _respond("get_components_details", (tuple(component_names), framework), build)
     except Exception as e:
-        print(f"Error in get_component_details: {str(e)}")
+        logger.exception("Tool failed", tool="get_components_details")
         return {"success": False, "error": str(e)}
 
 # Add knowledge base as a resource
 @mcp.resource(name="modus_kb", uri="http://localhost:3001/resources/modus_kb")
-def get_knowledge_base():
+@admitted
+async def get_knowledge_base():
     """Knowledge base for Modus components with examples and best practices"""
     try:
-        kb_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 
-                            "Knowledge Base", "From_KB.md")
-        ui_kb_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 
-                               "Knowledge Base", "UI_KB.md")
-        
-        # Combine content from both knowledge bases
-        content = ""
-        
-        # Read form components KB
-        if os.path.exists(kb_path):
-            with open(kb_path, 'r', encoding='utf-8') as f:
-                content += f.read()
-        
-        # Read UI components KB
-        if os.path.exists(ui_kb_path):
-            with open(ui_kb_path, 'r', encoding='utf-8') as f:
-                content += "\n\n" + f.read()
-        
-        return {
-            "content": content,
-            "type": "markdown",
-            "description": "Knowledge base for Modus components including examples"
-        }
-    except Exception as e:
-        print(f"Error loading knowledge base: {e}")
+        return await _respond("modus_kb", (), registry.get_knowledge_base, pinned=True, cacheable=None, etag=True)
+    except Exception:
+        logger.exception("Resource failed", resource="modus_kb")
         return None
 
+# Conditional read of the knowledge base: pass the "etag" of a previous read
+@mcp.resource(name="modus_kb_if_none_match", uri="http://localhost:3001/resources/modus_kb/if-none-match/{etag}")
+@admitted
+async def get_knowledge_base_if_none_match(etag: str):
+    """The modus_kb resource, or a short not-modified reply if its ETag is still `etag`"""
+    try:
+        response = await _respond("modus_kb", (), registry.get_knowledge_base, pinned=True, cacheable=None,
+                                  etag=True)
+        return _not_modified(response, etag)
+    except Exception:
+        logger.exception("Resource failed", resource="modus_kb_if_none_match")
+        return None
+
+# Listing of the per-component knowledge base resources
+@mcp.resource(name="modus_kb_index", uri="modus://kb", mime_type="application/json")
+@admitted
+async def get_knowledge_base_index():
+    """Components with knowledge base examples per framework, and how many examples each has"""
+    try:
+        return await _respond(
+            "modus_kb_index", (),
+            lambda: {
+                "success": True,
+                "uri_template": "modus://kb/{framework}/{component}",
+                "frameworks": registry.list_kb_sections()
+            },
+            pinned=True, etag=True
+        )
+    except Exception as e:
+        logger.exception("Resource failed", resource="modus_kb_index")
+        return {"success": False, "error": str(e)}
+
+# One component's knowledge base examples, e.g. modus://kb/react/ModusTable
+@mcp.resource(name="modus_kb_section", uri="modus://kb/{framework}/{component}", mime_type="application/json")
+@admitted
+async def get_knowledge_base_section(framework: str, component: str):
+    """Knowledge base examples of one component for one framework (react or angular)"""
+    try:
+        def build():
+            section = registry.get_kb_section(component, framework)
+            if section is None:
+                return _component_not_found(component, f"has no knowledge base section for {framework}",
+                                            framework=framework.lower())
+            return {"success": True, **section}
+
+        return await _respond("modus_kb_section", (framework.lower(), component), build, etag=True)
+    except ValueError as e:
+        return {"success": False, "error": str(e)}
+    except Exception as e:
+        logger.exception("Resource failed", resource="modus_kb_section")
+        return {"success": False, "error": str(e)}
+
 # Tool 4: Get icons by character prefix
 @mcp.tool()
-def get_modus_icons_by_char(char_prefix: str = ""):
-    """Get Modus icon names that start with the specified character prefix"""
+@instrumented
+@admitted
+async def get_modus_icons_by_char(char_prefix: str = "", limit: int = 100, offset: int = 0,
+                                  format: str = None):
+    """Get Modus icon names that start with the specified character prefix
+
+    Results are paginated: pass the returned next_offset as offset to get the next
+    page. An empty prefix pages through all icons. format="compact" returns the page
+    without whitespace.
+    """
     try:
-        if char_prefix:
-            icons = registry.get_icon_names_by_char(char_prefix)
-            return {
-                "success": True, 
-                "char_prefix": char_prefix,
+        if limit < 1:
+            return {"success": False, "error": f"limit must be at least 1, got {limit}"}
+        if offset < 0:
+            return {"success": False, "error": f"offset must not be negative, got {offset}"}
+        error = _unknown_format(format)
+        if error:
+            return error
+        # Prefixes match case-insensitively: spellings of the same prefix share one cache entry
+        char_prefix = char_prefix.strip().lower()
+
+        def build():
+            icons, total = registry.search_icons_by_prefix(char_prefix, limit=limit, offset=offset)
+            next_offset = offset + len(icons)
+            result = {
+                "success": True,
                 "icon_count": len(icons),
+                "total_count": total,
+                "offset": offset,
+                "next_offset": next_offset if next_offset < total else None,
                 "icons": icons
             }
-        else:
-            # If no prefix is provided, return all icons
-            icons = registry.get_all_icon_names()
+            if char_prefix:
+                result["char_prefix"] = char_prefix
+            elif format != "compact":
+                result["message"] = "Returning all icons (no prefix specified)"
+            if format == "compact":
+                result["format"] = "compact"
+            return result
+        
+        # The default first page of the full listing is identical for everyone: keep it pinned
+        response = await _respond(
+            "get_modus_icons_by_char", (char_prefix, limit, offset, format == "compact"), build,
+            pinned=not char_prefix and limit == 100 and offset == 0, cacheable=None
+        )
+        return _encoded(response)
+    except Exception as e:
+        logger.exception("Tool failed", tool="get_modus_icons_by_char")
+        return {"success": False, "error": str(e)}
+
+# Tool 5: Fuzzy/synonym icon search
+@mcp.tool()
+@instrumented
+@admitted
+async def search_modus_icons(query: str, top_k: int = 10):
+    """Search Modus icon names by meaning or partial spelling (e.g. "trash", "gear", "calender")
+
+    Returns the best matching icon names ranked by relevance, at most `top_k` (1-50)
+    of them. Prefer this over listing all icons when the exact icon name is not known.
+    """
+    try:
+        if not 1 <= top_k <= 50:
+            return {"success": False, "error": f"top_k must be between 1 and 50, got {top_k}"}
+        
+        def build():
+            icons = registry.search_icons(query, top_k=top_k)
             return {
-                "success": True, 
-                "message": "Returning all icons (no prefix specified)",
+                "success": True,
+                "query": query,
                 "icon_count": len(icons),
                 "icons": icons
             }
+        
+        # Icon search ignores case and surrounding whitespace: such spellings share one cache
+        # entry, and the response echoes the caller's own query
+        response = await _respond("search_modus_icons", (query.strip().lower(), top_k), build)
+        return {**response, "query": query}
+    except Exception as e:
+        logger.exception("Tool failed", tool="search_modus_icons")
+        return {"success": False, "error": str(e)}
+
+# Tool 6: Full-text search across components, properties and KB examples
+@mcp.tool()
+@instrumented
+@admitted
+async def search_modus(query: str, framework: str = None, top_k: int = 10):
+    """Search all Modus components, properties, events, methods and KB examples at once
+
+    Use this to answer questions like "which component has a clearable prop" or
+    "examples with pagination". Results are ranked by relevance (BM25) and point to
+    the component (and property or example prompt) to fetch with get_component_details.
+    Pass framework='angular' or 'react' to restrict examples to one framework, and
+    `top_k` (1-50) to set the number of results.
+    """
+    try:
+        if not 1 <= top_k <= 50:
+            return {"success": False, "error": f"top_k must be between 1 and 50, got {top_k}"}
+        
+        def build():
+            results = registry.search(query, framework=framework, top_k=top_k)
+            return {
+                "success": True,
+                "query": query,
+                "framework": framework,
+                "result_count": len(results),
+                "results": results
+            }
+        
+        # Queries with the same search terms share one cache entry; the response echoes the
+        # caller's own query
+        response = await _respond("search_modus", (registry.search_terms(query), framework, top_k), build)
+        return {**response, "query": query}
+    except Exception as e:
+        logger.exception("Tool failed", tool="search_modus")
+        return {"success": False, "error": str(e)}
+
+# Tool 7: Knowledge base index status
+@mcp.tool()
+@instrumented
+@admitted
+async def get_knowledge_base_status():
+    """Get the generation and last rebuild time of the in-memory knowledge base index"""
+    try:
+        return {
+            "success": True,
+            "index": registry.get_index_status(),
+            "hot_reload": kb_watcher.get_status(),
+            "response_cache": response_cache.get_stats(),
+            "request_coalescing": single_flight.get_stats(),
+            "startup": boot_timings
+        }
     except Exception as e:
-        print(f"Error in get_modus_icons_by_char: {str(e)}")
+        logger.exception("Tool failed", tool="get_knowledge_base_status")
         return {"success": False, "error": str(e)}
 
+# Tool 8: Server metrics
+@mcp.tool()
+@instrumented
+@admitted
+async def get_server_stats():
+    """Get per-tool call counts, latency percentiles, error counts, response sizes, cache hit ratios
+    and the load shed by rate limiting and admission control"""
+    try:
+        return {
+            "success": True,
+            **tool_metrics.get_stats(),
+            "response_cache": response_cache.get_stats(),
+            "request_coalescing": single_flight.get_stats(),
+            "admission": admission.get_stats(),
+            "index": registry.get_index_status(),
+            "logs_rate_limited": log_rate_limit.dropped
+        }
+    except Exception as e:
+        logger.exception("Tool failed", tool="get_server_stats")
+        return {"success": False, "error": str(e)}
+
+def render_metrics():
+    """Render all server metrics in the Prometheus text exposition format"""
+    cache = response_cache.get_stats()
+    coalescing = single_flight.get_stats()
+    admission_stats = admission.get_stats()
+    lines = tool_metrics.prometheus_lines()
+    lines += [
+        "# HELP modus_response_cache_hits_total Response cache hits",
+        "# TYPE modus_response_cache_hits_total counter",
+        *(f'modus_response_cache_hits_total{{tool="{tool}"}} {stats["hits"]}'
+          for tool, stats in cache["per_tool"].items()),
+        "# HELP modus_response_cache_misses_total Response cache misses",
+        "# TYPE modus_response_cache_misses_total counter",
+        *(f'modus_response_cache_misses_total{{tool="{tool}"}} {stats["misses"]}'
+          for tool, stats in cache["per_tool"].items()),
+        "# HELP modus_response_cache_entries Cached responses",
+        "# TYPE modus_response_cache_entries gauge",
+        f'modus_response_cache_entries{{kind="lru"}} {cache["entries"]}',
+        f'modus_response_cache_entries{{kind="pinned"}} {cache["pinned_entries"]}',
+        "# HELP modus_response_cache_evictions_total Responses evicted from the LRU",
+        "# TYPE modus_response_cache_evictions_total counter",
+        f"modus_response_cache_evictions_total {cache['evictions']}",
+        "# HELP modus_requests_coalesced_total Requests served by an identical in-flight build",
+        "# TYPE modus_requests_coalesced_total counter",
+        f"modus_requests_coalesced_total {coalescing['coalesced']}",
+        "# HELP modus_requests_in_flight Requests being served",
+        "# TYPE modus_requests_in_flight gauge",
+        f"modus_requests_in_flight {admission_stats['in_flight']}",
+        "# HELP modus_requests_queued Requests waiting for an in-flight slot",
+        "# TYPE modus_requests_queued gauge",
+        f"modus_requests_queued {admission_stats['queued']}",
+        "# HELP modus_requests_shed_total Requests rejected by rate limiting or admission control",
+        "# TYPE modus_requests_shed_total counter",
+        *(f'modus_requests_shed_total{{reason="{reason}"}} {count}'
+          for reason, count in admission_stats["shed"].items()),
+        "# HELP modus_kb_generation Generation of the live knowledge base index",
+        "# TYPE modus_kb_generation gauge",
+        f"modus_kb_generation {registry.generation}",
+        "# HELP modus_log_records_dropped_total Log records dropped by the rate limit",
+        "# TYPE modus_log_records_dropped_total counter",
+        f"modus_log_records_dropped_total {log_rate_limit.dropped}"
+    ]
+    return "\n".join(lines) + "\n"
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics_endpoint(request):
+    """Prometheus scrape endpoint"""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
 # Start the server when this module is run directly
 if __name__ == "__main__":
-    print("Starting Modus Components MCP Server on http://localhost:3001")
-    print("Available tools:")
-    print("- getting_started_installation_and_guidelines")
-    print("- get_list_of_all_modus_components")
-    print("- get_component_details (optional parameter: framework='angular')")
-    print("- get_modus_icons_by_char")
+    logger.info("Starting Modus Components MCP Server", url=f"http://localhost:{port}", tools=[
+        "getting_started_installation_and_guidelines",
+        "get_list_of_all_modus_components",
+        "get_component_details",
+        "get_components_details",
+        "get_modus_icons_by_char",
+        "search_modus_icons",
+        "search_modus",
+        "get_knowledge_base_status",
+        "get_server_stats"
+    ], metrics=f"http://localhost:{port}/metrics")
+
+    async def warm_up(server):
+        """Once the server accepts connections, prebuild shared responses and lazy parts"""
+        while not server.started:
+            await asyncio.sleep(0.01)
+        boot_timings["ready_ms"] = _elapsed_ms()
+        # Prebuild the responses that are identical for every caller; the first one
+        # gives the time it takes a fresh process to answer a request. The unwrapped
+        # tools are called so the warm-up does not show up in the tool metrics.
+        await get_list_of_all_modus_components.__wrapped__()
+        boot_timings["first_response_ms"] = _elapsed_ms()
+        await getting_started_installation_and_guidelines.__wrapped__()
+        await get_modus_icons_by_char.__wrapped__()
+        logger.info("Ready for SSE connections", ready_ms=boot_timings["ready_ms"],
+                    first_response_ms=boot_timings["first_response_ms"])
+        # Load the Angular knowledge base and build the search index in the background
+        # (with an index file, only the lookup tables: the rest is read from the mapping)
+        warm_up_start = time.perf_counter()
+        await work_pool.run(registry.warm_up)
+        boot_timings["warm_up_ms"] = _elapsed_ms(warm_up_start)
+        logger.info("Background warm-up finished", warm_up_ms=boot_timings["warm_up_ms"])
+
+    async def serve():
+        """Run the SSE server like FastMCP.run(transport="sse"), with the warm-up alongside"""
+        import uvicorn
+
+        server = uvicorn.Server(uvicorn.Config(
+            mcp.sse_app(),
+            host=mcp.settings.host,
+            port=mcp.settings.port,
+            log_level=mcp.settings.log_level.lower()
+        ))
+        warm_up_task = asyncio.create_task(warm_up(server))
+        try:
+            await server.serve()
+        finally:
+            warm_up_task.cancel()
+
+    if kb_watcher.interval > 0:
+        kb_watcher.start()
+        logger.info("Watching for knowledge base changes", path=registry.index_path or registry.kb_dir,
+                    interval_s=kb_watcher.interval)
     try:
-        mcp.run(transport="sse")
-    except Exception as e:
-        print(f"Error starting server: {e}")
-        sys.exit(1)
\ No newline at end of file
+        asyncio.run(serve())
+    except Exception:
+        logger.exception("Error starting server")
+        sys.exit(1)
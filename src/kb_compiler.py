@@ -0,0 +1,101 @@
+"""Knowledge Base compiler for the Modus Components MCP server
+
+Parses the Knowledge Base (db.json, db_ui.json, the markdown knowledge bases,
+modus_icons.json and the guidelines) once and writes the versioned, checksummed index
+artifact that the server memory-maps at startup instead of parsing markdown. The
+artifact records a fingerprint of every source file, so the server falls back to
+parsing the Knowledge Base itself when the artifact is out of date.
+
+Malformed sections found while parsing (for example a "# <Name>" header where the
+server expects "#<Name>") are reported with their file and line.
+
+Usage:
+    python src/kb_compiler.py             # write Knowledge Base/modus_index.bin
+    python src/kb_compiler.py --check     # exit with 1 if the artifact is missing or stale
+    python src/kb_compiler.py --strict    # exit with 1, writing nothing, if any section is malformed
+"""
+import argparse
+import os
+import sys
+import time
+
+from modules.component_registry import ComponentRegistry
+from modules.index_store import IndexStore
+from modules.structured_log import configure_logging
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Compile the Modus Knowledge Base into a prebuilt index artifact")
+    parser.add_argument("--output", help="Artifact path (default: Knowledge Base/modus_index.bin)")
+    parser.add_argument("--check", action="store_true",
+                        help="Only check that the artifact exists, is intact and is up to date")
+    parser.add_argument("--strict", action="store_true",
+                        help="Fail without writing the artifact when the Knowledge Base has malformed sections")
+    return parser.parse_args()
+
+
+def report_sources(registry):
+    """Print the load status and parse issues of every Knowledge Base file
+
+    Returns:
+        tuple: (number of files that failed to load, number of parse issues)
+    """
+    failed = 0
+    issue_count = 0
+    for name, source in registry.get_source_report().items():
+        if not source["loaded"]:
+            failed += 1
+            print(f"{name}: could not be loaded")
+        for issue in source["issues"]:
+            issue_count += 1
+            print(f"{name}:{issue['line']}: {issue['message']} (found '{issue['header']}')")
+    return failed, issue_count
+
+
+def check_artifact(registry, path):
+    """Print whether the artifact at path can be used by the server
+
+    Returns:
+        int: Process exit code
+    """
+    try:
+        store = IndexStore(path)
+    except Exception as e:
+        print(f"{path}: cannot be used: {e}")
+        return 1
+    problems = registry.check_index_store(store)
+    if problems:
+        print(f"{path}: {'; '.join(problems)}")
+        return 1
+    print(f"{path}: up to date (schema {store.meta['schema_version']}, {store.size} bytes)")
+    return 0
+
+
+def main():
+    args = parse_args()
+    configure_logging(log_format="text")
+    registry = ComponentRegistry(use_artifact=False)
+    output = os.path.abspath(args.output or registry.artifact_path)
+    if args.check:
+        return check_artifact(registry, output)
+
+    failed, issue_count = report_sources(registry)
+    if failed:
+        print(f"{failed} Knowledge Base file(s) could not be loaded, no artifact written")
+        return 1
+    if issue_count and args.strict:
+        print(f"{issue_count} malformed section(s) found, no artifact written")
+        return 1
+
+    start = time.perf_counter()
+    registry.export_index_store(output)
+    store = IndexStore(output)
+    print(f"Wrote {output} ({store.size} bytes, {len(store.keys())} entries, "
+          f"{len(registry.get_all_components())} components) in {(time.perf_counter() - start) * 1000:.1f} ms")
+    if issue_count:
+        print(f"{issue_count} malformed section(s) found")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
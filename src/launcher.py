@@ -0,0 +1,106 @@
+"""Multi-worker launcher for the Modus Components MCP server
+
+Builds the Knowledge Base index once, writes it to a memory-mappable index file and
+starts N server workers that map that file instead of parsing the Knowledge Base
+themselves. Worker i listens on base_port + i. MCP SSE sessions are stateful (the
+POST /messages/ calls must reach the worker holding the /sse stream), so the load
+balancer in front of the workers needs session affinity.
+
+The launcher also watches the Knowledge Base directory: on changes it rebuilds the
+index, replaces the index file atomically and the workers re-map it.
+
+Usage:
+    python src/launcher.py --workers 4 --base-port 3001
+"""
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+
+from modules.component_registry import ComponentRegistry
+from modules.kb_watcher import KnowledgeBaseWatcher
+from modules.structured_log import configure_logging
+
+SERVER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ModusFromMCP.py")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run several Modus MCP server workers sharing one prebuilt index")
+    parser.add_argument("--workers", type=int, default=int(os.environ.get("MODUS_WORKERS", os.cpu_count() or 1)),
+                        help="Number of worker processes (default: MODUS_WORKERS or the CPU count)")
+    parser.add_argument("--base-port", type=int, default=int(os.environ.get("MODUS_PORT", "3001")),
+                        help="Port of the first worker; worker i listens on base-port + i")
+    parser.add_argument("--index-path", default=os.environ.get("MODUS_INDEX_PATH",
+                                                                os.path.join(tempfile.gettempdir(), "modus_index.bin")),
+                        help="Where to write the shared index file")
+    parser.add_argument("--reload-interval", type=float,
+                        default=float(os.environ.get("MODUS_KB_RELOAD_INTERVAL", "2")),
+                        help="Seconds between Knowledge Base polls, 0 disables hot reload")
+    return parser.parse_args()
+
+
+def start_worker(worker_id, port, index_path, reload_interval):
+    """Start one server worker mapping the shared index file"""
+    env = dict(os.environ)
+    env["MODUS_PORT"] = str(port)
+    env["MODUS_INDEX_PATH"] = index_path
+    env["MODUS_KB_RELOAD_INTERVAL"] = str(reload_interval)
+    print(f"Starting worker {worker_id} on port {port}")
+    return subprocess.Popen([sys.executable, SERVER_SCRIPT], env=env)
+
+
+def main():
+    args = parse_args()
+    configure_logging()
+    registry = ComponentRegistry()
+    registry.export_index_store(args.index_path)
+    print(f"Wrote index (generation {registry.generation}) to {args.index_path}")
+
+    def rebuild_index(changed_paths):
+        generation = registry.generation
+        if registry.reload(changed_paths) != generation:
+            registry.export_index_store(args.index_path)
+
+    watcher = KnowledgeBaseWatcher(registry.kb_dir, rebuild_index, interval=args.reload_interval or 2.0)
+    if args.reload_interval > 0:
+        watcher.start()
+
+    ports = [args.base_port + worker_id for worker_id in range(args.workers)]
+    workers = {
+        worker_id: start_worker(worker_id, port, args.index_path, args.reload_interval)
+        for worker_id, port in enumerate(ports)
+    }
+
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    try:
+        while not stopping:
+            for worker_id, process in workers.items():
+                if process.poll() is not None:
+                    print(f"Worker {worker_id} exited with code {process.returncode}, restarting")
+                    workers[worker_id] = start_worker(worker_id, ports[worker_id], args.index_path,
+                                                      args.reload_interval)
+            time.sleep(1)
+    finally:
+        watcher.stop()
+        for process in workers.values():
+            process.terminate()
+        for process in workers.values():
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+import asyncio
+import functools
+import threading
+import time
+import weakref
+
+
+class Overloaded(Exception):
+    """Raised when a request is shed instead of being served
+
+    Attributes:
+        reason: "rate_limited", "queue_full" or "queue_timeout"
+        retry_after: Seconds the client should wait before retrying
+    """
+
+    def __init__(self, reason, retry_after):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Allows `burst` requests up front, refilled at `rate` requests per second (not thread-safe)"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def take(self):
+        """Take a token
+
+        Returns:
+            float: 0 if a token was taken, otherwise the seconds until one is available
+        """
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class AdmissionController:
+    """Per-session rate limits and a global in-flight cap with a bounded wait queue
+
+    Each MCP session gets its own token bucket, dropped with the session. Admitted
+    requests beyond `max_in_flight` wait in a queue of at most `max_queue` requests for
+    up to `queue_timeout` seconds. Requests over a limit are rejected at once with a
+    retry-after hint instead of adding to everyone's latency.
+    """
+
+    def __init__(self, rate=20.0, burst=40, max_in_flight=16, max_queue=64, queue_timeout=2.0):
+        """
+        Args:
+            rate: Requests per second allowed per session, 0 to disable the rate limit
+            burst: Requests a session may send at once before the rate applies
+            max_in_flight: Requests served concurrently, 0 to disable the cap
+            max_queue: Requests allowed to wait for a slot
+            queue_timeout: Seconds a request waits for a slot before it is rejected
+        """
+        self.rate = rate
+        self.burst = burst
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._lock = threading.Lock()
+        self._buckets = weakref.WeakKeyDictionary()
+        self._slots = asyncio.Semaphore(max_in_flight) if max_in_flight else None
+        self.in_flight = 0
+        self.queued = 0
+        self.peak_in_flight = 0
+        self.peak_queued = 0
+        self.admitted = 0
+        self.shed = {"rate_limited": 0, "queue_full": 0, "queue_timeout": 0}
+        self.shed_by_tool = {}
+        # Moving average of the time a request holds a slot, for retry-after hints
+        self._service_seconds = 0.05
+
+    def _check_rate(self, session):
+        if not self.rate or session is None:
+            return
+        with self._lock:
+            bucket = self._buckets.get(session)
+            if bucket is None:
+                bucket = self._buckets[session] = TokenBucket(self.rate, self.burst)
+            wait = bucket.take()
+        if wait:
+            raise Overloaded("rate_limited", wait)
+
+    def _queue_wait_estimate(self):
+        return self._service_seconds * (self.queued + 1) / self.max_in_flight
+
+    async def _acquire_slot(self):
+        if self._slots is None:
+            return
+        if self._slots.locked():
+            if self.queued >= self.max_queue:
+                raise Overloaded("queue_full", self._queue_wait_estimate())
+            self.queued += 1
+            self.peak_queued = max(self.peak_queued, self.queued)
+            try:
+                await asyncio.wait_for(self._slots.acquire(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                raise Overloaded("queue_timeout", self._queue_wait_estimate()) from None
+            finally:
+                self.queued -= 1
+        else:
+            await self._slots.acquire()
+
+    async def run(self, session, fn, *args, **kwargs):
+        """Await fn(*args, **kwargs) once the session's rate limit and a slot allow it
+
+        Args:
+            session: The caller's session object, None for internal calls (no rate limit)
+
+        Raises:
+            Overloaded: If the request is shed
+        """
+        self._check_rate(session)
+        await self._acquire_slot()
+        self.admitted += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        start = time.perf_counter()
+        try:
+            return await fn(*args, **kwargs)
+        finally:
+            self.in_flight -= 1
+            self._service_seconds += (time.perf_counter() - start - self._service_seconds) * 0.1
+            if self._slots is not None:
+                self._slots.release()
+
+    def guard(self, get_session, rejected):
+        """Decorator running an async tool through admission control
+
+        Args:
+            get_session: Zero-argument callable returning the current session or None
+            rejected: Callable turning an Overloaded exception into the tool's response
+        """
+        def decorator(fn):
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                try:
+                    return await self.run(get_session(), fn, *args, **kwargs)
+                except Overloaded as e:
+                    with self._lock:
+                        self.shed[e.reason] += 1
+                        self.shed_by_tool[fn.__name__] = self.shed_by_tool.get(fn.__name__, 0) + 1
+                    return rejected(e)
+            return wrapper
+        return decorator
+
+    def get_stats(self):
+        return {
+            "rate_per_session": self.rate or None,
+            "burst_per_session": self.burst if self.rate else None,
+            "max_in_flight": self.max_in_flight or None,
+            "max_queue": self.max_queue if self.max_in_flight else None,
+            "sessions": len(self._buckets),
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "peak_in_flight": self.peak_in_flight,
+            "peak_queued": self.peak_queued,
+            "admitted": self.admitted,
+            "shed": dict(self.shed),
+            "shed_by_tool": dict(self.shed_by_tool)
+        }
@@ -0,0 +1,85 @@
+import re
+
+# Column order of the tables in compact responses; columns no record uses are left out
+TABLE_COLUMNS = {
+    "properties": ("name", "type", "description", "default", "required", "options", "properties"),
+    "events": ("name", "description", "emits"),
+    "methods": ("name", "description", "parameters", "returns")
+}
+
+# Columns holding type strings, which compact tables store as indexes into "types"
+TYPE_COLUMNS = ("type", "emits", "returns")
+
+# Elements whose text keeps its whitespace, so code containing them is not minified
+_WHITESPACE_SENSITIVE = re.compile(r"<(pre|textarea)\b", re.IGNORECASE)
+
+
+def to_table(records, columns, types):
+    """Turn a list of dicts into a header row plus value rows
+
+    Args:
+        records: Dicts sharing (mostly) the same keys
+        columns: Preferred column order; keys outside it are appended in first-seen order
+        types: Shared type string -> index mapping, extended with new type strings
+
+    Returns:
+        dict: {"columns": [...], "rows": [[...], ...]}, with missing values as None (and
+            left out at the end of a row) and the values of TYPE_COLUMNS replaced by their
+            index in `types`
+    """
+    used = [column for column in columns if any(column in record for record in records)]
+    for record in records:
+        used.extend(key for key in record if key not in used)
+
+    rows = []
+    for record in records:
+        row = []
+        for column in used:
+            value = record.get(column)
+            if column in TYPE_COLUMNS and isinstance(value, str):
+                value = types.setdefault(value, len(types))
+            row.append(value)
+        while row and row[-1] is None:
+            row.pop()
+        rows.append(row)
+    return {"columns": used, "rows": rows}
+
+
+def compact_component(record):
+    """Compact form of a component record: its tables and the type strings they share
+
+    Returns:
+        dict: {"types", "properties", "events", "methods"}
+    """
+    types = {}
+    compact = {field: to_table(record[field], columns, types) for field, columns in TABLE_COLUMNS.items()}
+    compact["types"] = list(types)
+    return compact
+
+
+def minify_code(code):
+    """Drop indentation, trailing whitespace and blank lines from a code example
+
+    Line breaks are kept (TypeScript relies on them for semicolon insertion), lines that
+    continue a multi-line template literal are kept verbatim, and code with <pre> or
+    <textarea> elements is returned unchanged because their content is whitespace-sensitive.
+    """
+    if _WHITESPACE_SENSITIVE.search(code):
+        return code
+    lines = []
+    in_template = False
+    for line in code.splitlines():
+        if in_template:
+            lines.append(line)
+        else:
+            stripped = line.strip()
+            if stripped:
+                lines.append(stripped)
+        if (line.count("`") - line.count("\\`")) % 2:
+            in_template = not in_template
+    return "\n".join(lines)
+
+
+def compact_examples(examples):
+    """Copies of rendered examples with minified code"""
+    return tuple({**example, "code": minify_code(example["code"])} for example in examples)
@@ -1,250 +1,962 @@
 import os
+import base64
 import json
+import threading
+import time
+from functools import partial
+from types import MappingProxyType
+
+from modules.compact_format import TABLE_COLUMNS, compact_component, compact_examples
+from modules.icon_index import IconIndex, load_icon_index
+from modules.index_store import (DerivedMapping, IndexStore, StoreMapping, StoredKnowledgeBase, find_stale_sources,
+                                 fingerprint_file, write_index_store)
+from modules.kb_index import KnowledgeBaseIndex, Lazy, load_component_database, load_markdown_kb, load_text
+from modules.kb_parser import render_example
+from modules.name_resolver import ComponentNameResolver
+from modules.search_index import build_search_index, tokenize
+from modules.structured_log import get_logger
+
+logger = get_logger("registry")
+
+# Fields a get_component_details response can be narrowed to
+DETAIL_FIELDS = ("description", "properties", "events", "methods", "examples")
+
+# Response encodings besides the default one (see compact_format.py)
+OUTPUT_FORMATS = ("compact",)
+
+# Version of the prebuilt index contents; bump it when parsing or the stored entries change
+# so that artifacts compiled by an older version are rebuilt instead of loaded
+INDEX_SCHEMA_VERSION = 3
+
+# Attributes of a store-backed snapshot that warm_up leaves to first use: they would
+# copy store contents into every worker process instead of reading the shared mapping
+STORE_LAZY_ATTRIBUTES = ("search_index", "knowledge_base")
+
+# Frameworks served by the per-component knowledge base resources
+KB_FRAMEWORKS = ("react", "angular")
+
+# Arguments of get_component_details an example cursor is tied to
+CURSOR_ARGUMENTS = ("component", "framework", "max_examples", "include_code", "include_questions")
+
+
+def encode_example_cursor(generation, offset, page_size, request):
+    """Encode the position and size of the next example page as an opaque cursor
+
+    Args:
+        generation: Generation of the index the pages are read from
+        offset: Position of the next page's first example
+        page_size: Number of examples per page
+        request: The arguments the pages are for (see decode_example_cursor)
+    """
+    data = json.dumps({"generation": generation, "offset": offset, "page_size": page_size, "request": request},
+                      separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode("utf-8")).decode("ascii")
+
+
+def decode_example_cursor(cursor):
+    """Decode a cursor made by encode_example_cursor
+
+    Returns:
+        tuple: (generation, offset, page_size, request) where request holds the
+            "component", "framework", "max_examples", "include_code" and
+            "include_questions" the cursor was issued for
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        generation, offset, page_size = int(data["generation"]), int(data["offset"]), int(data["page_size"])
+        request = dict(data["request"])
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    if offset < 0 or page_size < 1 or set(request) != set(CURSOR_ARGUMENTS):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return generation, offset, page_size, request
+
 
 class ComponentRegistry:
     """Registry for Modus components, handling component details and examples"""
     
-    def __init__(self):
+    def __init__(self, index_path=None, use_artifact=True):
+        """
+        Args:
+            index_path: Optional prebuilt index file (see export_index_store) to
+                memory-map instead of parsing the Knowledge Base files
+            use_artifact: Load the compiled index shipped next to the Knowledge Base
+                (see kb_compiler.py) when it is present and up to date
+        """
         # Paths for knowledge base files
         self.base_path = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        self.kb_dir = os.path.join(self.base_path, "Knowledge Base")
         self.db_path = os.path.join(self.base_path, "Knowledge Base", "db.json")
         self.db_ui_path = os.path.join(self.base_path, "Knowledge Base", "db_ui.json")
         self.kb_path = os.path.join(self.base_path, "Knowledge Base", "From_KB.md")
         self.ui_kb_path = os.path.join(self.base_path, "Knowledge Base", "UI_KB.md")
         self.angular_kb_path = os.path.join(self.base_path, "Knowledge Base", "angular_KB.md")
         self.icons_path = os.path.join(self.base_path, "Knowledge Base", "modus_icons.json")
-    
-    def get_all_components(self):
-        """Get list of all available components (both form and UI)"""
+        self.guidelines_path = os.path.join(self.base_path, "Knowledge Base", "Modus_Components_Guidelines.md")
+        self.artifact_path = os.path.join(self.base_path, "Knowledge Base", "modus_index.bin")
+
+        # Each indexed source file and the loader that turns it into its part of the index
+        self._part_loaders = {
+            self.db_path: partial(load_component_database, category="form"),
+            self.db_ui_path: partial(load_component_database, category="ui"),
+            self.kb_path: load_markdown_kb,
+            self.ui_kb_path: load_markdown_kb,
+            self.angular_kb_path: partial(load_markdown_kb, framework="angular"),
+            self.icons_path: load_icon_index,
+            self.guidelines_path: load_text
+        }
+        # Rarely used parts (most traffic is React) are loaded on first access or by warm_up
+        self._lazy_paths = (self.angular_kb_path,)
+
+        self._reload_lock = threading.Lock()
+        self.index_path = os.path.abspath(index_path) if index_path else None
+        if self.index_path:
+            self._index = self._load_index_store(IndexStore(self.index_path), time.perf_counter())
+            return
+
+        start = time.perf_counter()
+        index = self._load_artifact(start) if use_artifact else None
+        if index is None:
+            # Parse the knowledge base once; every lookup is served from the in-memory index
+            parts = self._load_parts(lazy=self._lazy_paths)
+            index = self._build_index(parts, 1, start, tuple(parts))
+        self._index = index
+
+    def _load_part(self, path):
+        """Load one Knowledge Base file, or return None if it cannot be loaded"""
         try:
-            components = []
-            
-            # Get form components
-            with open(self.db_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if "components" in data and "form" in data["components"]:
-                    components.extend(list(data["components"]["form"].keys()))
-            
-            # Get UI components
-            with open(self.db_ui_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if "components" in data and "ui" in data["components"]:
-                    components.extend(list(data["components"]["ui"].keys()))
-            
-            return components
+            return self._part_loaders[path](path)
         except Exception as e:
-            print(f"Error getting component list: {e}")
-            return []
-    
-    def get_component_properties_and_events(self, component_name):
-        """Get properties, events and description for a specific component"""
+            logger.error("Error loading knowledge base file", path=path, error=str(e))
+            return None
+
+    def _load_parts(self, lazy=()):
+        """Load every Knowledge Base file, deferring the paths in lazy to first access"""
+        return {
+            path: Lazy(partial(self._load_part, path)) if path in lazy else self._load_part(path)
+            for path in self._part_loaders
+        }
+
+    def _build_search_index(self, index):
+        """Build the full-text search index of a snapshot (a Lazy attribute factory)"""
+        return build_search_index(index.components, (
+            ("react", os.path.basename(self.kb_path), index.parts.get(self.kb_path)),
+            ("react", os.path.basename(self.ui_kb_path), index.parts.get(self.ui_kb_path)),
+            ("angular", os.path.basename(self.angular_kb_path), index.parts.get(self.angular_kb_path))
+        ))
+
+    def _build_name_resolver(self, index):
+        """Build the component name resolution table of an index snapshot
+
+        Names resolve to the components of db.json and db_ui.json only; knowledge base
+        sections are resolved per framework by _build_section_resolver. React examples
+        of components whose name starts with "Modus" (and of a few UI components) are
+        taken from UI_KB.md before From_KB.md, others the other way round, as the
+        registry has always looked them up.
+        """
+        ui_first = ("ModusTable", "ModusTabs", "ModusToast", "ModusToolbar", "ModusTooltip")
+        knowledge_bases = [(kb_path, index.parts.get(kb_path)) for kb_path in (self.kb_path, self.ui_kb_path)]
+        knowledge_bases = [(kb_path, kb) for kb_path, kb in knowledge_bases if kb is not None]
+
+        names = list(index.component_names)
+        for kb_path, kb in knowledge_bases:
+            names.extend(kb.sections)
+
+        react_sources = {}
+        for name in dict.fromkeys(names):
+            order = reversed(knowledge_bases) if name.startswith("Modus") or name in ui_first else knowledge_bases
+            for kb_path, kb in order:
+                if kb.sections.get(name):
+                    react_sources[name] = kb_path
+                    break
+        return ComponentNameResolver(index.component_names, react_sources)
+
+    def _build_section_resolver(self, index, framework):
+        """Build the name resolution table of the knowledge base sections of one framework"""
+        kb_paths = (self.angular_kb_path,) if framework == "angular" else (self.kb_path, self.ui_kb_path)
+        names = []
+        for kb_path in kb_paths:
+            kb = index.parts.get(kb_path)
+            if kb is not None:
+                names.extend(kb.sections)
+        return ComponentNameResolver(names)
+
+    def _build_compact_index(self, index):
+        """Precompute the compact form of every component record and example list
+
+        Returns:
+            dict: {"components": name -> compact record (see compact_component),
+                "examples": framework ('react' or 'angular') -> name -> examples with minified code}
+        """
+        components = {name: compact_component(index.components[name]) for name in dict.fromkeys(index.component_names)}
+        react = {name: compact_examples(self._find_examples(name, None, index))
+                 for name in index.name_resolver.react_names()}
+        angular_kb = index.parts.get(self.angular_kb_path)
+        angular = {name: compact_examples(examples)
+                   for name, examples in (angular_kb.rendered.items() if angular_kb is not None else ())}
+        return MappingProxyType({
+            "components": MappingProxyType(components),
+            "examples": MappingProxyType({"react": MappingProxyType(react), "angular": MappingProxyType(angular)})
+        })
+
+    def _load_compact_index(self, store, index):
+        """Compact form of a store-backed snapshot, shaped like _build_compact_index
+
+        The compact component records are read from the store, where export_index_store
+        wrote them; examples are minified from the stored examples on access.
+        """
+        angular_kb = index.parts.get(self.angular_kb_path)
+        return MappingProxyType({
+            "components": StoreMapping(store, "compact/components/"),
+            "examples": MappingProxyType({
+                "react": DerivedMapping(index.name_resolver.react_names(),
+                                        lambda name: compact_examples(self._find_examples(name, None, index))),
+                "angular": DerivedMapping(angular_kb.rendered if angular_kb is not None else (),
+                                          lambda name: compact_examples(angular_kb.rendered[name]))
+            })
+        })
+
+    def _load_artifact(self, start):
+        """Load the compiled index artifact, or return None if it is missing or stale"""
+        if not os.path.exists(self.artifact_path):
+            return None
         try:
-            # Check form components first
-            with open(self.db_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            if ("components" in data and 
-                "form" in data["components"] and 
-                component_name in data["components"]["form"]):
-                
-                component_data = data["components"]["form"][component_name]
-                return {
-                    "properties": component_data.get("properties", []),
-                    "events": component_data.get("events", []),
-                    "methods": component_data.get("methods", []),
-                    "description": component_data.get("description", "")
-                }
-            
-            # If not found in form components, check UI components
-            with open(self.db_ui_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            if ("components" in data and 
-                "ui" in data["components"] and 
-                component_name in data["components"]["ui"]):
-                
-                component_data = data["components"]["ui"][component_name]
-                return {
-                    "properties": component_data.get("properties", []),
-                    "events": component_data.get("events", []),
-                    "methods": component_data.get("methods", []),
-                    "description": component_data.get("description", "")                
-                    }
-            
-            return {"properties": [], "events": [], "methods": [], "description": ""}
-        
+            store = IndexStore(self.artifact_path)
+        except Exception as e:
+            logger.warning("Error opening compiled index, parsing the Knowledge Base", path=self.artifact_path,
+                           error=str(e))
+            return None
+        problems = self.check_index_store(store)
+        if problems:
+            logger.warning("Compiled index not used, parsing the Knowledge Base", path=self.artifact_path,
+                           problems=problems)
+            return None
+        return self._load_index_store(store, start, source="artifact")
+
+    def check_index_store(self, store):
+        """Check that a prebuilt index is intact and matches the Knowledge Base on disk
+
+        Args:
+            store: The opened IndexStore
+
+        Returns:
+            list: Descriptions of the problems found, empty if the index can be used
+        """
+        problems = []
+        schema_version = store.meta.get("schema_version")
+        if schema_version != INDEX_SCHEMA_VERSION:
+            problems.append(f"schema version {schema_version}, expected {INDEX_SCHEMA_VERSION}")
+        if not store.verify():
+            problems.append("checksum mismatch")
+        stale = find_stale_sources(store.meta.get("sources", {}), tuple(self._part_loaders))
+        if stale:
+            problems.append(f"out of date: {', '.join(stale)}")
+        return problems
+
+    def _build_index(self, parts, generation, start, rebuilt_paths):
+        """Derive a complete index snapshot from the loaded parts
+
+        Form components take precedence over UI components sharing the same name,
+        matching the lookup order the registry has always used.
+
+        Args:
+            parts: Source path -> loaded part (None if the file could not be loaded,
+                Lazy if loading is deferred to first access)
+            generation: Generation number of the new snapshot
+            start: perf_counter() value when the (re)build started
+            rebuilt_paths: The source paths that were (re)loaded for this snapshot
+
+        Returns:
+            KnowledgeBaseIndex: The new snapshot
+        """
+        form_components = parts.get(self.db_path) or {}
+        ui_components = parts.get(self.db_ui_path) or {}
+
+        components = dict(ui_components)
+        components.update(form_components)
+        component_names = tuple(form_components) + tuple(ui_components)
+
+        # Combined From_KB.md + UI_KB.md payload served by the modus_kb resource
+        knowledge_base = ""
+        if parts.get(self.kb_path) is not None:
+            knowledge_base += parts[self.kb_path].text
+        if parts.get(self.ui_kb_path) is not None:
+            knowledge_base += "\n\n" + parts[self.ui_kb_path].text
+
+        return KnowledgeBaseIndex(
+            generation,
+            parts,
+            components=MappingProxyType(components),
+            search_index=Lazy(self._build_search_index),
+            name_resolver=Lazy(self._build_name_resolver),
+            react_section_resolver=Lazy(partial(self._build_section_resolver, framework="react")),
+            angular_section_resolver=Lazy(partial(self._build_section_resolver, framework="angular")),
+            compact=Lazy(self._build_compact_index),
+            component_names=component_names,
+            knowledge_base=knowledge_base,
+            built_at=time.time(),
+            build_seconds=time.perf_counter() - start,
+            rebuilt_files=tuple(os.path.basename(path) for path in rebuilt_paths),
+            source="live"
+        )
+
+    def _load_index_store(self, store, start, source="index_store"):
+        """Build an index snapshot backed by a memory-mapped prebuilt index file
+
+        Component records and examples are decoded from the shared mapping on access;
+        the search index is built on first use.
+
+        Args:
+            store: The opened IndexStore
+            start: perf_counter() value when loading started
+            source: How the index file was provided, reported by get_index_status
+        """
+        knowledge_bases = store.meta.get("knowledge_bases", {})
+
+        parts = {}
+        for kb_path in (self.kb_path, self.ui_kb_path, self.angular_kb_path):
+            info = knowledge_bases.get(os.path.basename(kb_path))
+            parts[kb_path] = StoredKnowledgeBase(store, os.path.basename(kb_path), info) if info else None
+        icons = store.get("icons")
+        parts[self.icons_path] = IconIndex(icons) if icons is not None else None
+        parts[self.guidelines_path] = store.get("guidelines")
+
+        components = StoreMapping(store, "components/")
+        return KnowledgeBaseIndex(
+            store.meta.get("generation", 1),
+            parts,
+            components=components,
+            component_names=tuple(store.get("component_names", ())),
+            knowledge_base=Lazy(lambda index: store.get("knowledge_base", "")),
+            search_index=Lazy(self._build_search_index),
+            name_resolver=Lazy(self._build_name_resolver),
+            react_section_resolver=Lazy(partial(self._build_section_resolver, framework="react")),
+            angular_section_resolver=Lazy(partial(self._build_section_resolver, framework="angular")),
+            compact=Lazy(partial(self._load_compact_index, store)),
+            built_at=time.time(),
+            build_seconds=time.perf_counter() - start,
+            rebuilt_files=(os.path.basename(store.path),),
+            source=source,
+            store=store
+        )
+
+    def export_index_store(self, index_path):
+        """Write the live index to a prebuilt, memory-mappable index file
+
+        Args:
+            index_path: Destination path; the file is replaced atomically
+        """
+        index = self._index
+        entries = {"component_names": list(index.component_names)}
+        for name, record in index.components.items():
+            entries[f"components/{name}"] = {
+                key: list(value) if isinstance(value, tuple) else value
+                for key, value in record.items()
+            }
+        for name, compact in index.compact["components"].items():
+            entries[f"compact/components/{name}"] = compact
+
+        knowledge_bases = {}
+        for kb_path in (self.kb_path, self.ui_kb_path, self.angular_kb_path):
+            kb = index.parts.get(kb_path)
+            if kb is None:
+                continue
+            name = os.path.basename(kb_path)
+            knowledge_bases[name] = {"framework": kb.framework, "issues": [list(issue) for issue in kb.issues]}
+            # Rendered examples are derived from the sections when they are read
+            for component_name, examples in kb.sections.items():
+                entries[f"kb/{name}/sections/{component_name}"] = list(examples)
+
+        entries["knowledge_base"] = index.knowledge_base
+        icon_index = index.parts.get(self.icons_path)
+        if icon_index is not None:
+            entries["icons"] = list(icon_index.names)
+        if index.parts.get(self.guidelines_path) is not None:
+            entries["guidelines"] = index.parts[self.guidelines_path]
+
+        write_index_store(index_path, entries, {
+            "schema_version": INDEX_SCHEMA_VERSION,
+            "generation": index.generation,
+            "built_at": time.time(),
+            "sources": {
+                os.path.basename(path): fingerprint_file(path)
+                for path in self._part_loaders if os.path.exists(path)
+            },
+            "knowledge_bases": knowledge_bases
+        })
+
+    def reload(self, changed_paths):
+        """Rebuild the parts of the index backed by changed files and swap it in atomically
+
+        Files that fail to load (for example a JSON file caught mid-save) keep their
+        previous part; an index loaded from the compiled artifact is rebuilt from every
+        file and stays live if any of them fails. Requests already holding the old
+        snapshot finish against it. The new snapshot is warmed up (see warm_up) right
+        after the swap.
+
+        Args:
+            changed_paths: Paths of the Knowledge Base files that changed on disk
+
+        Returns:
+            int: The generation of the index that is live after the reload
+        """
+        with self._reload_lock:
+            start = time.perf_counter()
+            current = self._index
+            if self.index_path:
+                return self._reload_index_store(changed_paths, start)
+            changed_paths = [os.path.abspath(path) for path in changed_paths]
+            changed_paths = [path for path in changed_paths if path in self._part_loaders]
+            if not changed_paths:
+                return current.generation
+            if current.source != "live":
+                # Parts decoded from the compiled index cannot be patched file by file:
+                # parse every file, and keep the compiled index if any of them fails
+                parts = {}
+                for path, loader in self._part_loaders.items():
+                    try:
+                        parts[path] = loader(path)
+                    except Exception as e:
+                        logger.error("Error reloading, keeping previous version", path=path, error=str(e))
+                        return current.generation
+                reloaded = list(parts)
+            else:
+                parts = current.parts.unresolved()
+                reloaded = []
+                for path in changed_paths:
+                    try:
+                        parts[path] = self._part_loaders[path](path)
+                    except Exception as e:
+                        logger.error("Error reloading, keeping previous version", path=path, error=str(e))
+                        continue
+                    reloaded.append(path)
+
+            if not reloaded:
+                return current.generation
+
+            index = self._build_index(parts, current.generation + 1, start, reloaded)
+            # A single reference assignment: readers see either the old or the new index
+            self._index = index
+            logger.info("Knowledge base reloaded", generation=index.generation,
+                        build_ms=round(index.build_seconds * 1000, 1), files=list(index.rebuilt_files))
+            # Build the lazy structures now, as the boot warm-up does, not on the first requests
+            self.warm_up()
+            return index.generation
+
+    def _reload_index_store(self, changed_paths, start):
+        """Re-map the prebuilt index file after it was replaced (reload lock held)"""
+        if self.index_path not in (os.path.abspath(path) for path in changed_paths):
+            return self._index.generation
+        try:
+            index = self._load_index_store(IndexStore(self.index_path), start)
         except Exception as e:
-            print(f"Error getting component properties: {e}")
+            logger.error("Error reloading index file, keeping previous version", path=self.index_path,
+                         error=str(e))
+            return self._index.generation
+        self._index = index
+        logger.info("Index file reloaded", generation=index.generation)
+        self.warm_up()
+        return index.generation
+
+    @property
+    def generation(self):
+        """Generation number of the live index, incremented on every reload"""
+        return self._index.generation
+
+    def get_index_status(self):
+        """Get generation and rebuild timing of the live index"""
+        index = self._index
+        return {
+            "generation": index.generation,
+            "built_at": index.built_at,
+            "last_rebuild_ms": round(index.build_seconds * 1000, 3),
+            "last_rebuilt_files": list(index.rebuilt_files),
+            "source": index.source,
+            "component_count": len(index.components),
+            "pending": [os.path.basename(name) for name in index.pending()]
+        }
+
+    def warm_up(self):
+        """Load the deferred parts of the live index and build its lazy structures
+
+        Snapshots backed by an index file leave STORE_LAZY_ATTRIBUTES to first use.
+
+        Returns:
+            float: Seconds spent, 0 if nothing was pending
+        """
+        start = time.perf_counter()
+        index = self._index
+        skip = STORE_LAZY_ATTRIBUTES if index.source != "live" else ()
+        if not [name for name in index.pending() if name not in skip]:
+            return 0.0
+        index.warm_up(skip=skip)
+        return time.perf_counter() - start
+
+    def get_source_report(self):
+        """Get, per Knowledge Base file, whether it loaded and the parse issues found in it
+
+        Returns:
+            dict: File name -> {"loaded": bool, "issues": [{"line", "header", "message"}]}
+        """
+        index = self._index
+        report = {}
+        for path in self._part_loaders:
+            part = index.parts.get(path)
+            report[os.path.basename(path)] = {
+                "loaded": part is not None,
+                "issues": [
+                    {"line": line, "header": header, "message": message}
+                    for line, header, message in getattr(part, "issues", ())
+                ]
+            }
+        return report
+
+    def get_all_components(self):
+        """Get list of all available components (both form and UI)"""
+        return list(self._index.component_names)
+    
+    def resolve_component_name(self, component_name, index=None):
+        """Get the registry name for a spelling of a component name
+
+        Args:
+            component_name: E.g. "ModusCheckbox", "checkbox", "ModusCheckBox" or "modus-checkbox"
+            index: Index snapshot to read from, defaults to the live index
+
+        Returns:
+            str: The registry name, or None if the name does not resolve
+        """
+        return (index or self._index).name_resolver.resolve(component_name)
+
+    def resolve_component_names(self, component_names, index=None):
+        """Resolve several component names and drop repeats of the same component
+
+        Names that do not resolve are kept as given (once each), in request order.
+
+        Returns:
+            list: Registry names, or the given spelling for unknown names
+        """
+        resolver = (index or self._index).name_resolver
+        return list(dict.fromkeys(resolver.resolve(name) or name for name in component_names))
+
+    def suggest_component_names(self, component_name, limit=3, framework=None):
+        """Get registry names close to a name that did not resolve, best match first
+
+        With a framework ('react' or 'angular'), suggest from that framework's knowledge
+        base sections instead of the component registry.
+        """
+        index = self._index
+        resolver = getattr(index, f"{framework}_section_resolver") if framework else index.name_resolver
+        return resolver.suggest(component_name, limit=limit)
+
+    def get_component_properties_and_events(self, component_name, index=None):
+        """Get properties, events and description for a specific component"""
+        index = index or self._index
+        component_name = index.name_resolver.resolve(component_name) or component_name
+        component_data = index.components.get(component_name)
+        if component_data is None:
             return {"properties": [], "events": [], "methods": [], "description": ""}
+
+        return {
+            "properties": list(component_data["properties"]),
+            "events": list(component_data["events"]),
+            "methods": list(component_data["methods"]),
+            "description": component_data["description"]
+        }
+
+    def get_component_details(self, component_name, framework=None, index=None, fields=None,
+                              max_examples=None, include_code=True, include_questions=True,
+                              page_size=None, cursor=None, output_format=None):
+        """Get properties, events, methods and examples for a component from one index snapshot
+
+        Only the requested parts of the response are built, so narrow requests cost
+        proportionally less to assemble and serialize.
+
+        With page_size, examples are returned page by page: the first page carries the
+        requested fields and the first page_size examples, and "next_cursor" (None on
+        the last page) fetches the following examples only. Cursors are tied to the
+        index generation, so a page never mixes examples of two Knowledge Base versions,
+        and to the component, framework and example options of the first page.
+
+        With output_format="compact", properties, events and methods are tables (a
+        "columns" header plus "rows") whose type strings are indexes into a shared
+        "types" list, and examples are a table with minified code; all of it is
+        precomputed once per index snapshot.
+
+        Args:
+            component_name: The component name to look up, in any spelling accepted by
+                resolve_component_name
+            framework: 'angular' for Angular examples, otherwise React
+            index: Index snapshot to read from, defaults to the live index
+            fields: Detail fields to include (see DETAIL_FIELDS), None for all of them
+            max_examples: Maximum number of examples to include, None for all
+            include_code: Whether examples include their code
+            include_questions: Whether examples include the user question
+            page_size: Number of examples per page, None to return them all at once
+            cursor: The next_cursor of the previous page (which also carries its page size)
+            output_format: "compact" for the compact encoding, None for the default one
+
+        Returns:
+            dict: Component details, or None if the component is not in the registry
+
+        Raises:
+            ValueError: If fields contains an unknown field name, output_format is unknown,
+                max_examples is negative, page_size is below 1, or the cursor is invalid, was issued before a
+                Knowledge Base reload or for other arguments
+        """
+        if output_format is not None and output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unknown format: {output_format}. Valid formats are: {', '.join(OUTPUT_FORMATS)}")
+        if fields is None:
+            fields = DETAIL_FIELDS
+        else:
+            unknown = [field for field in fields if field not in DETAIL_FIELDS]
+            if unknown:
+                raise ValueError(f"Unknown fields: {', '.join(unknown)}. "
+                                 f"Valid fields are: {', '.join(DETAIL_FIELDS)}")
+
+        if max_examples is not None and max_examples < 0:
+            raise ValueError(f"max_examples must not be negative, got {max_examples}")
+        if page_size is not None and page_size < 1:
+            raise ValueError(f"page_size must be at least 1, got {page_size}")
+
+        index = index or self._index
+        component_name = index.name_resolver.resolve(component_name)
+        component_data = index.components.get(component_name) if component_name else None
+        if component_data is None or not component_data["properties"]:
+            return None
+
+        angular = bool(framework) and framework.lower() == "angular"
+        request = {"component": component_name, "framework": "angular" if angular else "react",
+                   "max_examples": max_examples, "include_code": include_code,
+                   "include_questions": include_questions}
+        offset = None
+        if cursor is not None:
+            generation, offset, cursor_page_size, cursor_request = decode_example_cursor(cursor)
+            page_size = page_size or cursor_page_size
+            if generation != index.generation:
+                raise ValueError("The knowledge base was reloaded since this cursor was issued; "
+                                 "request the first page again")
+            mismatched = [f"{key}={cursor_request[key]!r}" for key in CURSOR_ARGUMENTS
+                          if cursor_request[key] != request[key]]
+            if mismatched:
+                raise ValueError(f"This cursor was issued for {', '.join(mismatched)}; "
+                                 "pass the same arguments as for the first page")
+            # Pages after the first one only carry examples
+            fields = ("examples",)
+        elif page_size is not None:
+            offset = 0
+
+        details = {"component": component_name}
+        compact = index.compact["components"][component_name] if output_format == "compact" else None
+        if compact is not None:
+            details["format"] = "compact"
+            if any(field in fields for field in TABLE_COLUMNS):
+                details["types"] = compact["types"]
+        for field in ("description", "properties", "events", "methods"):
+            if field in fields:
+                value = component_data[field]
+                if compact is not None and field != "description":
+                    details[field] = compact[field]
+                else:
+                    details[field] = value if field == "description" else list(value)
+
+        if "examples" in fields:
+            if compact is not None:
+                examples = index.compact["examples"]["angular" if angular else "react"].get(component_name, ())
+            else:
+                examples = self._find_examples(component_name, "angular" if angular else None, index)
+            if max_examples is not None:
+                examples = examples[:max_examples]
+            if offset is not None:
+                total = len(examples)
+                end = offset + page_size
+                examples = examples[offset:end]
+                details["example_offset"] = offset
+                details["example_count"] = total
+                details["next_cursor"] = (encode_example_cursor(index.generation, end, page_size, request)
+                                          if end < total else None)
+            example_keys = ["prompt_number"]
+            if include_questions:
+                example_keys.append("question")
+            if include_code:
+                example_keys.append("code")
+            if compact is not None:
+                details["examples"] = {"columns": example_keys,
+                                       "rows": [[example[key] for key in example_keys] for example in examples]}
+            else:
+                details["examples"] = [{key: example[key] for key in example_keys} for example in examples]
+
+        details["framework"] = framework or "React"
+        return details
         
-    def _extract_kb_examples(self, content, component_name, framework=None):
+    def get_components_details(self, component_names, framework=None):
+        """Get details for several components at once from a single index snapshot
+
+        Repeated names, including different spellings of the same component, are
+        resolved once. Properties that are identical in two or more
+        of the requested components are returned once under "shared_properties" and
+        referenced by key from each component's "shared_properties" list.
+
+        Args:
+            component_names: Component names to look up
+            framework: 'angular' for Angular examples, otherwise React
+
+        Returns:
+            dict: {"framework", "shared_properties", "components", "not_found"}
+        """
+        index = self._index
+        components = []
+        not_found = []
+        for component_name in self.resolve_component_names(component_names, index):
+            details = self.get_component_details(component_name, framework, index=index)
+            if details is None:
+                not_found.append(component_name)
+                continue
+            del details["framework"]
+            components.append(details)
+
+        # Count identical property definitions across the requested components
+        property_keys = [
+            [json.dumps(prop, sort_keys=True) for prop in details["properties"]]
+            for details in components
+        ]
+        usage = {}
+        for keys in property_keys:
+            for key in set(keys):
+                usage[key] = usage.get(key, 0) + 1
+
+        shared_properties = {}
+        shared_refs = {}
+        for details, keys in zip(components, property_keys):
+            own_properties = []
+            shared = []
+            for prop, key in zip(details["properties"], keys):
+                if usage[key] < 2:
+                    own_properties.append(prop)
+                    continue
+                if key not in shared_refs:
+                    ref = prop.get("name", "property")
+                    suffix = 2
+                    while ref in shared_properties:
+                        ref = f"{prop.get('name', 'property')}_{suffix}"
+                        suffix += 1
+                    shared_refs[key] = ref
+                    shared_properties[ref] = prop
+                shared.append(shared_refs[key])
+            details["properties"] = own_properties
+            details["shared_properties"] = shared
+
+        return {
+            "framework": framework or "React",
+            "shared_properties": shared_properties,
+            "components": components,
+            "not_found": not_found
+        }
+
+    def _extract_kb_examples(self, content, component_name, framework=None, index=None):
         """Extract examples for a specific component from the knowledge base
         
         Args:
-            content: The content to extract from
+            content: Unused, kept for backwards compatibility; examples come from the index
             component_name: The component name to find examples for
             framework: The framework to use - 'angular' for Angular examples, otherwise React
+            index: Index snapshot to read from, defaults to the live index
             
         Returns:
             list: List of examples for the component
         """
-        examples = []
         try:
-            # If angular framework is specified, extract from angular KB
-            if framework == "angular":
-                return self._extract_examples_from_content(self.angular_kb_path, component_name, framework="angular")
-            
-            # Default behavior for React
-            modus_list = ["ModusTable", "ModusTabs", "ModusToast", "ModusToolbar", "ModusTooltip"]
-            if component_name.startswith("Modus") or component_name in modus_list:
-                examples = self._extract_examples_from_content(self.ui_kb_path, component_name)
-                if not examples:
-                    examples = self._extract_examples_from_content(self.kb_path, component_name)
-            else:
-                examples = self._extract_examples_from_content(self.kb_path, component_name)
-                if not examples:
-                    examples = self._extract_examples_from_content(self.ui_kb_path, component_name)
-            
-            return examples       
-        except Exception as e:
-            print(f"Error extracting examples: {e}")
+            examples = self._find_examples(component_name, framework, index or self._index)
+            return [dict(example) for example in examples]
+        except Exception:
+            logger.exception("Error extracting examples", component=component_name)
             return []
-    
-    def _extract_examples_from_content(self, kb_path, component_name, framework=None):
-            """Helper method to extract examples from a specific KB file"""
-            try:
-                with open(kb_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                examples = []
-                
-                # Find the component section more robustly using regex-like pattern matching
-                print(component_name)
-                component_marker = f"# <{component_name}>"
-                start_index = content.find(component_marker)
-                
-                if start_index == -1:
-                    print(f"Component {component_name} not found in {kb_path}")
-                    return []
-                
-                # Find the next component section or end of file
-                next_component_index = content.find("# <", start_index + len(component_marker))
-                
-                if next_component_index == -1:
-                    # If this is the last component in the file
-                    component_section = content[start_index:]
-                else:
-                    component_section = content[start_index:next_component_index]
-                
-                # Extract examples from the component section
-                prompts = component_section.split("## Prompt")
-                
-                # Skip the first split which contains the component header
-                for i, prompt in enumerate(prompts[1:], 1):
-                    example = {
-                        "prompt_number": i,
-                        "question": "",
-                        "code": ""
-                    }
-                    
-                    # Extract the user question
-                    question_parts = prompt.split("**User Question:**")
-                    if len(question_parts) > 1:
-                        answer_parts = question_parts[1].split("**Agent Answer:**")
-                        if len(answer_parts) > 0:
-                            example["question"] = answer_parts[0].strip()
-                    
-                    # Extract the code example - handle both tsx/jsx for React and HTML/TypeScript for Angular
-                    if framework == "angular":
-                        # For Angular, look for HTML and TypeScript blocks
-                        html_start = prompt.find("```html")
-                        ts_start = prompt.find("```typescript")
-                        
-                        if html_start != -1:
-                            html_end = prompt.find("```", html_start + 7)
-                            if html_end != -1:
-                                html_code = prompt[html_start + 7:html_end].strip()
-                                
-                                # Add HTML code
-                                if example["code"]:
-                                    example["code"] += "\n\n/* HTML Template */\n" + html_code
-                                else:
-                                    example["code"] = "/* HTML Template */\n" + html_code
-                        
-                        if ts_start != -1:
-                            ts_end = prompt.find("```", ts_start + 13)
-                            if ts_end != -1:
-                                ts_code = prompt[ts_start + 13:ts_end].strip()
-                                
-                                # Add TypeScript code
-                                if example["code"]:
-                                    example["code"] += "\n\n/* TypeScript Component */\n" + ts_code
-                                else:
-                                    example["code"] = "/* TypeScript Component */\n" + ts_code
-                    else:
-                        # Original React handling
-                        code_start = prompt.find("```tsx")
-                        if code_start == -1:
-                            code_start = prompt.find("```jsx")
-                            code_type_len = 6  # "```jsx" length
-                        else:
-                            code_type_len = 6  # "```tsx" length
-                        
-                        code_end = prompt.find("```", code_start + code_type_len) if code_start != -1 else -1
-                        
-                        if code_start != -1 and code_end != -1:
-                            example["code"] = prompt[code_start + code_type_len:code_end].strip()
-                    
-                    examples.append(example)
-                
-                return examples
-            except Exception as e:
-                print(f"Error extracting examples from {kb_path}: {e}")
-                return []
+
+    def _find_examples(self, component_name, framework, index):
+        """Get the pre-rendered examples for a component without copying them
+
+        Returns:
+            tuple: Examples in the tool response shape (shared, do not modify)
+        """
+        # If angular framework is specified, extract from angular KB
+        if framework == "angular":
+            return self._lookup_examples(self.angular_kb_path, component_name, "angular", index)
+
+        # React examples come from the one KB file the resolution table points to
+        kb_path = index.name_resolver.react_source(component_name)
+        if kb_path is None:
+            logger.debug("Component not found in knowledge base", component=component_name)
+            return ()
+        return self._lookup_examples(kb_path, component_name, None, index)
+
+    def search(self, query, framework=None, top_k=10):
+        """Full-text search across component metadata and KB examples
+
+        Args:
+            query: Free-text query such as "clearable" or "pagination example"
+            framework: 'react' or 'angular' to restrict examples to one framework
+            top_k: Maximum number of results
+
+        Returns:
+            list: BM25-ranked results with a pointer (type, component, ...) and snippet
+        """
+        framework = framework.lower() if framework else None
+        return self._index.search_index.search(query, framework=framework, top_k=top_k)
+
+    def search_terms(self, query):
+        """Get the terms search ranks a query by; queries with the same terms get the same results"""
+        return tuple(sorted(set(tokenize(query))))
+
+    def get_knowledge_base(self):
+        """Get the prebuilt knowledge base resource payload"""
+        return {
+            "content": self._index.knowledge_base,
+            "type": "markdown",
+            "description": "Knowledge base for Modus components including examples"
+        }
+
+    def list_kb_sections(self):
+        """List the components that have knowledge base examples, per framework
+
+        Returns:
+            dict: framework -> {component name: number of examples}, in KB file order
+        """
+        index = self._index
+        listing = {}
+        for framework, kb_paths in (("react", (self.kb_path, self.ui_kb_path)), ("angular", (self.angular_kb_path,))):
+            names = {}
+            for kb_path in kb_paths:
+                kb = index.parts.get(kb_path)
+                if kb is not None:
+                    names.update(dict.fromkeys(kb.sections))
+            listing[framework] = {
+                name: len(self._find_examples(name, "angular" if framework == "angular" else None, index))
+                for name in names
+            }
+        return listing
+
+    def get_kb_section(self, component_name, framework="react"):
+        """Get one component's knowledge base examples for one framework
+
+        Args:
+            component_name: The component name, e.g. "ModusTable" or "table"
+            framework: 'react' or 'angular'
+
+        Returns:
+            dict: {"component", "framework", "examples"}, or None if the component has no section
+
+        Raises:
+            ValueError: If the framework is not one of KB_FRAMEWORKS
+        """
+        framework = framework.lower()
+        if framework not in KB_FRAMEWORKS:
+            raise ValueError(f"Unknown framework '{framework}', expected one of: {', '.join(KB_FRAMEWORKS)}")
+        index = self._index
+        component_name = getattr(index, f"{framework}_section_resolver").resolve(component_name)
+        if component_name is None:
+            return None
+        examples = self._find_examples(component_name, "angular" if framework == "angular" else None, index)
+        if not examples:
+            return None
+        return {
+            "component": component_name,
+            "framework": framework,
+            "examples": [dict(example) for example in examples]
+        }
+
+    def get_parsed_examples(self, kb_path, component_name, index=None):
+        """Get the structured examples for a component in a specific KB file
+
+        Args:
+            kb_path: Path to the markdown knowledge base
+            component_name: The component name to look up
+            index: Index snapshot to read from, defaults to the live index
+
+        Returns:
+            tuple: Parsed examples with code blocks grouped by language
+        """
+        kb = (index or self._index).parts.get(kb_path)
+        if kb is None:
+            return ()
+        return kb.sections.get(component_name, ())
+
+    def _extract_examples_from_content(self, kb_path, component_name, framework=None, index=None):
+        """Helper method to look up examples from a specific KB file in the prebuilt index"""
+        examples = self._lookup_examples(kb_path, component_name, framework, index or self._index)
+        return [dict(example) for example in examples]
+
+    def _lookup_examples(self, kb_path, component_name, framework, index):
+        """Get a component's examples from one KB file, rendered for the given framework"""
+        kb = index.parts.get(kb_path)
+        if kb is None:
+            examples = ()
+        elif kb.framework == framework:
+            examples = kb.rendered.get(component_name, ())
+        else:
+            examples = tuple(render_example(example, framework)
+                             for example in kb.sections.get(component_name, ()))
+
+        if not examples:
+            logger.debug("Component not found in knowledge base", component=component_name, path=kb_path)
+        return examples
             
     def get_installation_guidelines(self):
         """Get installation and usage guidelines"""
-        try:
-            guidelines_path = os.path.join(self.base_path, "Knowledge Base", "Modus_Components_Guidelines.md")
-            with open(guidelines_path, 'r', encoding='utf-8') as f:
-                guidelines = f.read()
-            return guidelines
-        except Exception as e:
-            print(f"Error loading guidelines: {e}")
+        guidelines = self._index.parts.get(self.guidelines_path)
+        if guidelines is None:
             return "Guidelines not available."
+        return guidelines
             
     def get_all_icon_names(self):
         """Get a list of all available Modus icon names"""
-        try:
-            with open(self.icons_path, 'r', encoding='utf-8') as f:
-                icons_data = json.load(f)
-            return icons_data.get("icons", [])
-        except Exception as e:
-            print(f"Error loading icon names: {e}")
-            return []
+        icon_index = self._index.parts.get(self.icons_path)
+        return list(icon_index.names) if icon_index is not None else []
+
+    def search_icons_by_prefix(self, char_prefix="", limit=None, offset=0):
+        """Get one page of icon names starting with a prefix from the sorted icon index
+
+        Args:
+            char_prefix (str): Case-insensitive prefix, empty to page through every icon
+            limit (int): Maximum number of names to return, None for all remaining
+            offset (int): Number of matching names to skip
+
+        Returns:
+            tuple: (list of icon names for the page, total number of matching icons)
+        """
+        icon_index = self._index.parts.get(self.icons_path)
+        if icon_index is None:
+            return [], 0
+        return icon_index.search_prefix(char_prefix or "", limit=limit, offset=offset)
             
-    def get_icon_names_by_char(self, char_prefix):
+    def search_icons(self, query, top_k=10):
+        """Rank icon names against a free-text query using the token/trigram index
+
+        Args:
+            query (str): Free-text query such as "trash" or "gear"
+            top_k (int): Maximum number of results
+
+        Returns:
+            list: [{"name", "score"}] ordered by descending score
+        """
+        icon_index = self._index.parts.get(self.icons_path)
+        if icon_index is None:
+            return []
+        return icon_index.search(query, top_k=top_k)
+
+    def get_icon_names_by_char(self, char_prefix, limit=None, offset=0):
         """Get a list of icon names starting with a specific character
         
         Args:
             char_prefix (str): The character prefix to filter icons by
+            limit (int): Maximum number of names to return, None for all
+            offset (int): Number of matching names to skip
             
         Returns:
             list: List of icon names starting with the specified character
         """
-        try:
-            if not char_prefix:
-                return []
-                
-            all_icons = self.get_all_icon_names()
-            
-            # Convert to lowercase for case-insensitive matching
-            prefix = char_prefix.lower()
-            
-            # Filter icons starting with the specified character
-            matching_icons = [icon for icon in all_icons if icon.lower().startswith(prefix)]
-            
-            return matching_icons
-        except Exception as e:
-            print(f"Error getting icons by character prefix: {e}")
-            return []
\ No newline at end of file
+        if not char_prefix:
+            return []
+        icons, _ = self.search_icons_by_prefix(char_prefix, limit=limit, offset=offset)
+        return icons
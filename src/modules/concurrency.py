@@ -0,0 +1,56 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+
+class WorkPool:
+    """Bounded thread pool for blocking file and CPU work off the event loop"""
+
+    def __init__(self, max_workers=4):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="modus-work")
+
+    async def run(self, fn, *args):
+        """Run fn(*args) in the pool and await its result"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+
+class SingleFlight:
+    """Coalesces concurrent identical requests into one in-flight computation
+
+    The first caller for a key starts the computation; callers arriving while it is
+    still running await the same task instead of repeating the work. A waiter being
+    cancelled does not cancel the shared computation.
+    """
+
+    def __init__(self):
+        self._in_flight = {}
+        self.started = 0
+        self.coalesced = 0
+
+    async def do(self, key, compute):
+        """Await the result of compute() for key, sharing it with concurrent callers
+
+        Args:
+            key: Hashable identity of the request
+            compute: Zero-argument coroutine function producing the result
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(compute())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+            self.started += 1
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def get_stats(self):
+        return {
+            "in_flight": len(self._in_flight),
+            "started": self.started,
+            "coalesced": self.coalesced
+        }
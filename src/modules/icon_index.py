@@ -0,0 +1,202 @@
+import json
+import re
+from bisect import bisect_left
+
+# Common words agents use for icons, mapped to the names/tokens used by Modus icons
+ICON_SYNONYMS = {
+    "trash": ["delete"], "bin": ["delete"], "garbage": ["delete"], "erase": ["delete", "eraser"],
+    "gear": ["settings", "gears"], "cog": ["settings", "gears"], "preferences": ["settings", "tune"],
+    "options": ["settings", "tune"], "config": ["settings"], "configuration": ["settings"],
+    "magnifier": ["search"], "find": ["search"], "lookup": ["search"],
+    "plus": ["add"], "new": ["add"], "create": ["add"], "minus": ["remove"],
+    "x": ["close"], "dismiss": ["close"], "exit": ["close", "sign_out"],
+    "edit": ["pencil", "pen"], "write": ["pencil", "pen"], "modify": ["pencil"],
+    "user": ["person", "user_account"], "profile": ["person", "user_account"],
+    "account": ["user_account", "person_account"], "avatar": ["person"],
+    "users": ["people_group"], "team": ["people_group"], "group": ["people_group"],
+    "bell": ["notifications"], "notification": ["notifications"], "alarm": ["notifications", "alarm_on"],
+    "mail": ["email", "envelope"], "message": ["chat", "comment", "email"],
+    "house": ["home"], "error": ["warning", "alert"], "danger": ["warning"], "caution": ["warning"],
+    "floppy": ["save_disk"], "save": ["save_disk", "save_as"],
+    "date": ["calendar"], "schedule": ["calendar", "clock"], "time": ["clock", "timer"],
+    "eye": ["visibility_on"], "show": ["visibility_on"], "hide": ["visibility_off"],
+    "hamburger": ["menu"], "dots": ["more_horizontal", "more_vertical"],
+    "ellipsis": ["more_horizontal", "more_vertical"], "kebab": ["more_vertical"],
+    "reload": ["refresh", "sync"], "attachment": ["paperclip"], "attach": ["paperclip"],
+    "favorite": ["star", "heart"], "favourite": ["star", "heart"], "like": ["thumbs_up", "heart"],
+    "ok": ["check"], "done": ["check"], "tick": ["check"], "success": ["check_circle"],
+    "back": ["arrow_back"], "previous": ["arrow_back", "chevron_left"], "next": ["arrow_next", "chevron_right"],
+    "duplicate": ["copy_content", "file_copy"], "copy": ["copy_content", "file_copy"],
+    "logout": ["sign_out"], "login": ["sign_in"], "signin": ["sign_in"], "signout": ["sign_out"],
+    "secure": ["lock", "shield"], "security": ["lock", "shield"], "unlock": ["lock_open"],
+    "gps": ["location", "map_marker"], "marker": ["map_marker", "pin"], "place": ["location", "map_marker"],
+    "chart": ["bar_graph", "line_graph"], "graph": ["bar_graph", "line_graph"], "analytics": ["bar_graph"],
+    "print": ["printer"], "call": ["phone", "phone_call"], "telephone": ["phone"],
+    "faq": ["help", "question"], "support": ["help", "headset"],
+    "photo": ["image", "camera"], "picture": ["image"], "file": ["file", "document"], "doc": ["document", "file"],
+    "funnel": ["filter"], "fullscreen": ["full_screen"], "maximize": ["full_screen", "expand"],
+    "minimize": ["collapse"], "url": ["link"], "hyperlink": ["link"],
+    "light": ["sun", "lightbulb_on"], "dark": ["moon"], "night": ["moon"],
+    "tool": ["wrench", "hammer"], "tools": ["wrench", "hammer"], "repair": ["wrench"],
+    "truck": ["delivery_truck"], "shipping": ["delivery_truck", "package"], "cart": ["shopping_cart"],
+    "money": ["costs", "credit_card"], "payment": ["credit_card", "payment_instant"], "pay": ["credit_card"],
+    "microphone": ["mic"], "globe": ["web", "language"], "internet": ["web", "wifi"],
+    "layers": ["layer"], "sliders": ["tune"], "revert": ["undo"], "sound": ["volume_up"],
+    "mute": ["volume_mute"], "speaker": ["volume_up"], "external": ["launch"], "open": ["launch", "folder_open"],
+    "directory": ["folder_closed", "folder_open"], "folder": ["folder_closed", "folder_open"],
+    "password": ["password", "key"], "bookmark": ["flag", "star"], "grid": ["view_grid", "apps"],
+    "list": ["view_list", "list_bulleted"], "send": ["paper_plane"], "tag": ["tag"], "label": ["tag"]
+}
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def _trigrams(token):
+    """Character trigrams of a token padded with boundary markers"""
+    padded = f"${token}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class IconIndex:
+    """Prefix and fuzzy search indexes over the Modus icon names
+
+    Names are kept sorted by their lowercase form, so every prefix query is two
+    binary searches plus a slice: O(log n + k) for k returned names. Free-text
+    search uses inverted indexes over underscore-split tokens and character trigrams.
+    """
+
+    __slots__ = ("names", "_keys", "_sorted_names", "_name_ids", "_token_postings",
+                 "_tokens", "_trigram_postings", "_trigram_counts")
+
+    def __init__(self, names):
+        self.names = tuple(names)
+        ordered = sorted(range(len(self.names)), key=lambda i: (self.names[i].lower(), i))
+        self._keys = [self.names[i].lower() for i in ordered]
+        self._sorted_names = tuple(self.names[i] for i in ordered)
+        self._build_search_index()
+
+    def _build_search_index(self):
+        """Build the inverted token and trigram indexes used by search()"""
+        self._name_ids = {}
+        token_postings = {}
+        trigram_postings = {}
+        self._trigram_counts = []
+        for icon_id, name in enumerate(self.names):
+            lowered = name.lower()
+            self._name_ids.setdefault(lowered, icon_id)
+            trigrams = set()
+            for token in lowered.split("_"):
+                if not token:
+                    continue
+                token_postings.setdefault(token, set()).add(icon_id)
+                trigrams |= _trigrams(token)
+            for trigram in trigrams:
+                trigram_postings.setdefault(trigram, []).append(icon_id)
+            self._trigram_counts.append(len(trigrams))
+
+        self._token_postings = {token: frozenset(ids) for token, ids in token_postings.items()}
+        self._tokens = sorted(self._token_postings)
+        self._trigram_postings = {trigram: tuple(ids) for trigram, ids in trigram_postings.items()}
+
+    def __len__(self):
+        return len(self.names)
+
+    def prefix_range(self, prefix):
+        """Get the [start, end) slice of sorted names matching a case-insensitive prefix"""
+        prefix = prefix.lower()
+        start = bisect_left(self._keys, prefix)
+        # Every key starting with the prefix sorts before prefix + the highest code point
+        end = bisect_left(self._keys, prefix + "\U0010ffff", start)
+        return start, end
+
+    def search_prefix(self, prefix, limit=None, offset=0):
+        """Get icon names starting with a prefix, one page at a time
+
+        Args:
+            prefix: Case-insensitive name prefix; an empty prefix matches every icon
+            limit: Maximum number of names to return, None for all remaining
+            offset: Number of matching names to skip
+
+        Returns:
+            tuple: (list of matching names for the page, total number of matches)
+        """
+        start, end = self.prefix_range(prefix)
+        total = end - start
+        page_start = start + max(offset, 0)
+        page_end = end if limit is None else min(end, page_start + max(limit, 0))
+        return list(self._sorted_names[page_start:page_end]), total
+
+    def _tokens_with_prefix(self, prefix):
+        """Get the indexed tokens that start with a prefix"""
+        start = bisect_left(self._tokens, prefix)
+        end = bisect_left(self._tokens, prefix + "\U0010ffff", start)
+        return self._tokens[start:end]
+
+    def search(self, query, top_k=10):
+        """Rank icons against a free-text query
+
+        Each query word (and its synonyms, at a lower weight) scores exact icon name
+        matches, exact underscore-token matches and token prefix matches. Character
+        trigram overlap adds a fuzzy component so misspellings still rank.
+
+        Args:
+            query: Free-text query such as "trash can" or "gear"
+            top_k: Maximum number of results to return
+
+        Returns:
+            list: [{"name", "score"}] ordered by descending score
+        """
+        words = TOKEN_PATTERN.findall(query.lower())
+        if not words or top_k <= 0:
+            return []
+
+        # (term, weight): the query words themselves, then their synonyms
+        terms = {word: 1.0 for word in words}
+        for word in words:
+            for synonym in ICON_SYNONYMS.get(word, ()):
+                terms.setdefault(synonym, 0.7)
+        joined = "_".join(words)
+        terms[joined] = max(terms.get(joined, 0.0), 1.0)
+
+        scores = {}
+        for term, weight in terms.items():
+            icon_id = self._name_ids.get(term)
+            if icon_id is not None:
+                scores[icon_id] = scores.get(icon_id, 0.0) + 5.0 * weight
+            for token in term.split("_"):
+                for icon_id in self._token_postings.get(token, ()):
+                    scores[icon_id] = scores.get(icon_id, 0.0) + 3.0 * weight
+                if len(token) < 2:
+                    continue
+                for prefixed in self._tokens_with_prefix(token):
+                    if prefixed == token:
+                        continue
+                    for icon_id in self._token_postings[prefixed]:
+                        scores[icon_id] = scores.get(icon_id, 0.0) + 1.5 * weight
+
+        # Fuzzy component: Dice coefficient between query and icon trigram sets
+        query_trigrams = set()
+        for word in words:
+            query_trigrams |= _trigrams(word)
+        shared = {}
+        for trigram in query_trigrams:
+            for icon_id in self._trigram_postings.get(trigram, ()):
+                shared[icon_id] = shared.get(icon_id, 0) + 1
+        for icon_id, count in shared.items():
+            dice = 2.0 * count / (len(query_trigrams) + self._trigram_counts[icon_id])
+            if dice >= 0.3:
+                scores[icon_id] = scores.get(icon_id, 0.0) + 2.0 * dice
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], len(self.names[item[0]]), self.names[item[0]]))
+        return [{"name": self.names[icon_id], "score": round(score, 3)} for icon_id, score in ranked[:top_k]]
+
+
+def load_icon_index(path):
+    """Load modus_icons.json into an IconIndex
+
+    Raises:
+        OSError, ValueError: If the file cannot be read or is not valid JSON
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        icons_data = json.load(f)
+    return IconIndex(icons_data.get("icons", []))
@@ -0,0 +1,225 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+from collections.abc import Mapping
+
+from modules.kb_parser import render_example
+
+# File layout: MAGIC | header struct (format version, header length) | header JSON | value blobs
+# The header JSON holds {"meta": {...}, "entries": {key: [offset, length]}, "checksum": sha256}
+# where offsets are relative to the first byte after the header and the checksum covers
+# every byte after the header. Every value is a compact JSON blob.
+MAGIC = b"MODUSIDX"
+FORMAT_VERSION = 2
+HEADER_STRUCT = struct.Struct("<IQ")
+_MISSING = object()
+
+
+def write_index_store(path, entries, meta):
+    """Write a prebuilt index file atomically
+
+    The file is written next to its final location and moved into place with
+    os.replace, so processes mapping the previous file keep a complete view.
+
+    Args:
+        path: Destination path of the index file
+        entries: dict of key -> JSON-serializable value
+        meta: JSON-serializable metadata stored in the header
+    """
+    blobs = []
+    toc = {}
+    offset = 0
+    checksum = hashlib.sha256()
+    for key, value in entries.items():
+        data = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        toc[key] = [offset, len(data)]
+        blobs.append(data)
+        checksum.update(data)
+        offset += len(data)
+
+    header = json.dumps({"meta": meta, "entries": toc, "checksum": checksum.hexdigest()},
+                        separators=(",", ":")).encode("utf-8")
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(HEADER_STRUCT.pack(FORMAT_VERSION, len(header)))
+        f.write(header)
+        for data in blobs:
+            f.write(data)
+    os.replace(temp_path, path)
+
+
+class IndexStore:
+    """Read-only, memory-mapped view of a prebuilt index file
+
+    Only the header is parsed when the file is opened; values are decoded from the
+    shared mapping on access. Worker processes mapping the same file share its pages
+    through the OS page cache instead of each holding a parsed copy.
+    """
+
+    def __init__(self, path):
+        """
+        Raises:
+            OSError: If the file cannot be opened
+            ValueError: If the file is not an index store of a supported version
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        prefix_length = len(MAGIC) + HEADER_STRUCT.size
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a Modus index file")
+        version, header_length = HEADER_STRUCT.unpack(self._mmap[len(MAGIC):prefix_length])
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{path} has index format version {version}, expected {FORMAT_VERSION}")
+
+        header = json.loads(self._mmap[prefix_length:prefix_length + header_length])
+        self.meta = header["meta"]
+        self._entries = header["entries"]
+        self.checksum = header["checksum"]
+        self._data_start = prefix_length + header_length
+
+    def verify(self):
+        """Check the stored values against the checksum recorded when the file was written
+
+        Returns:
+            bool: True if the file is intact
+        """
+        return hashlib.sha256(self._mmap[self._data_start:]).hexdigest() == self.checksum
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def keys(self, prefix=""):
+        """Get the stored keys starting with a prefix, in file order"""
+        return [key for key in self._entries if key.startswith(prefix)]
+
+    def get(self, key, default=None):
+        """Decode the value stored under key, or return default if there is none"""
+        location = self._entries.get(key)
+        if location is None:
+            return default
+        start = self._data_start + location[0]
+        return json.loads(self._mmap[start:start + location[1]])
+
+    @property
+    def size(self):
+        return len(self._mmap)
+
+
+def fingerprint_file(path):
+    """Get the size, modification time and SHA-256 of a source file"""
+    with open(path, "rb") as f:
+        data = f.read()
+        stat = os.fstat(f.fileno())
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": hashlib.sha256(data).hexdigest()}
+
+
+def find_stale_sources(fingerprints, paths):
+    """Compare source files on disk against the fingerprints recorded in an index file
+
+    Files whose size and modification time are unchanged are trusted without being
+    read; files with a new modification time (a fresh checkout or copy) are hashed,
+    so only real content changes make the index stale.
+
+    Args:
+        fingerprints: File name -> fingerprint as returned by fingerprint_file
+        paths: The source paths the index must have been built from
+
+    Returns:
+        list: Names of the files that are missing, new or changed
+    """
+    names = {os.path.basename(path) for path in paths}
+    stale = [name for name in fingerprints if name not in names]
+    for path in paths:
+        name = os.path.basename(path)
+        recorded = fingerprints.get(name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            if recorded is not None:
+                stale.append(name)
+            continue
+        if recorded is None or stat.st_size != recorded["size"]:
+            stale.append(name)
+        elif stat.st_mtime_ns != recorded["mtime_ns"] and fingerprint_file(path)["sha256"] != recorded["sha256"]:
+            stale.append(name)
+    return stale
+
+
+class StoreMapping(Mapping):
+    """Read-only mapping over the store keys sharing a prefix, decoded on access"""
+
+    def __init__(self, store, prefix):
+        self._store = store
+        self._prefix = prefix
+        self._names = tuple(key[len(prefix):] for key in store.keys(prefix))
+
+    def __getitem__(self, name):
+        value = self._store.get(self._prefix + name, _MISSING)
+        if value is _MISSING:
+            raise KeyError(name)
+        return value
+
+    def __contains__(self, name):
+        return (self._prefix + name) in self._store
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+
+class DerivedMapping(Mapping):
+    """Read-only mapping whose values are derived from their key on access
+
+    For values cheap to compute from what the store holds, so that they take no space
+    in the index file and no process keeps a decoded copy.
+    """
+
+    def __init__(self, keys, derive):
+        """
+        Args:
+            keys: The keys of the mapping, in iteration order
+            derive: Callable turning a key into its value
+        """
+        self._keys = dict.fromkeys(keys)
+        self._derive = derive
+
+    def __getitem__(self, key):
+        if key not in self._keys:
+            raise KeyError(key)
+        return self._derive(key)
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+
+class StoredKnowledgeBase:
+    """Store-backed counterpart of MarkdownKnowledgeBase for one markdown KB file
+
+    Only the parsed sections are stored; examples are rendered from them on access.
+    """
+
+    __slots__ = ("sections", "rendered", "framework", "issues")
+
+    def __init__(self, store, name, info):
+        self.framework = info.get("framework")
+        self.issues = tuple(tuple(issue) for issue in info.get("issues", ()))
+        self.sections = StoreMapping(store, f"kb/{name}/sections/")
+        self.rendered = DerivedMapping(self.sections, self._render)
+
+    def _render(self, component_name):
+        return tuple(render_example(example, self.framework) for example in self.sections[component_name])
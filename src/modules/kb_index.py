@@ -0,0 +1,175 @@
+import json
+import threading
+from collections.abc import Mapping
+from types import MappingProxyType
+
+from modules.kb_parser import parse_kb_content, render_example
+
+
+class MarkdownKnowledgeBase:
+    """Parsed form of a single markdown knowledge base file"""
+
+    __slots__ = ("text", "sections", "rendered", "framework", "issues")
+
+    def __init__(self, text, sections, framework=None, issues=()):
+        self.text = text
+        self.framework = framework
+        self.issues = tuple(issues)
+        # component name -> tuple of parsed examples (code blocks grouped by language)
+        self.sections = MappingProxyType(
+            {name: tuple(examples) for name, examples in sections.items()}
+        )
+        # component name -> tuple of examples already in the tool response shape
+        self.rendered = MappingProxyType({
+            name: tuple(render_example(example, framework) for example in examples)
+            for name, examples in self.sections.items()
+        })
+
+
+def load_component_database(path, category):
+    """Load db.json or db_ui.json into a read-only, ordered name -> record mapping
+
+    Args:
+        path: Path to the component database
+        category: The category key inside "components" ("form" or "ui")
+
+    Returns:
+        MappingProxyType: Component name -> read-only component record
+
+    Raises:
+        OSError, ValueError: If the file cannot be read or is not valid JSON
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    components = {}
+    for name, component_data in data.get("components", {}).get(category, {}).items():
+        components[name] = MappingProxyType({
+            "category": category,
+            "description": component_data.get("description", ""),
+            "properties": tuple(component_data.get("properties", [])),
+            "events": tuple(component_data.get("events", [])),
+            "methods": tuple(component_data.get("methods", []))
+        })
+    return MappingProxyType(components)
+
+
+def load_markdown_kb(path, framework=None):
+    """Read and parse one markdown knowledge base
+
+    Args:
+        path: Path to From_KB.md, UI_KB.md or angular_KB.md
+        framework: 'angular' for the Angular KB, otherwise examples render as React
+
+    Returns:
+        MarkdownKnowledgeBase: The parsed file
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    sections, issues = parse_kb_content(text)
+    return MarkdownKnowledgeBase(text, sections, framework, issues)
+
+
+def load_text(path):
+    """Read a plain text/markdown file that is served verbatim
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+class Lazy:
+    """Marks a snapshot part or derived attribute that is computed on first access
+
+    Factories of derived attributes are called with the snapshot; factories of parts
+    take no arguments.
+    """
+
+    __slots__ = ("factory",)
+
+    def __init__(self, factory):
+        self.factory = factory
+
+
+class LazyMapping(Mapping):
+    """Read-only mapping whose Lazy values are computed once, on first access"""
+
+    def __init__(self, items):
+        self._items = dict(items)
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key):
+        value = self._items[key]
+        if isinstance(value, Lazy):
+            with self._lock:
+                value = self._items[key]
+                if isinstance(value, Lazy):
+                    value = value.factory()
+                    self._items[key] = value
+        return value
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def pending(self):
+        """Get the keys whose values have not been computed yet"""
+        return [key for key, value in self._items.items() if isinstance(value, Lazy)]
+
+    def unresolved(self):
+        """Get a plain dict copy that keeps pending values pending"""
+        return dict(self._items)
+
+
+class KnowledgeBaseIndex:
+    """Immutable snapshot of everything the registry serves from the Knowledge Base
+
+    `parts` holds the loaded form of each source file keyed by path (parts passed as
+    Lazy are loaded on first access); every other attribute is derived from the parts
+    when the snapshot is built, or on first access for attributes passed as Lazy.
+    Reloads build a new snapshot and swap the registry's reference to it, so a reader
+    that grabbed a snapshot keeps a complete, consistent view for the whole request.
+    """
+
+    def __init__(self, generation, parts, **derived):
+        object.__setattr__(self, "generation", generation)
+        object.__setattr__(self, "parts", LazyMapping(parts))
+        object.__setattr__(self, "_lazy", {})
+        # Reentrant: a derived attribute's factory may read other lazy attributes
+        object.__setattr__(self, "_lazy_lock", threading.RLock())
+        for name, value in derived.items():
+            if isinstance(value, Lazy):
+                self._lazy[name] = value.factory
+            else:
+                object.__setattr__(self, name, value)
+
+    def __getattr__(self, name):
+        factory = self.__dict__.get("_lazy", {}).get(name)
+        if factory is None:
+            raise AttributeError(name)
+        with self._lazy_lock:
+            if name not in self.__dict__:
+                object.__setattr__(self, name, factory(self))
+        return self.__dict__[name]
+
+    def pending(self):
+        """Get the names of the parts and attributes that have not been computed yet"""
+        return self.parts.pending() + [name for name in self._lazy if name not in self.__dict__]
+
+    def warm_up(self, skip=()):
+        """Compute every pending part and every pending attribute not named in skip"""
+        for path in self.parts.pending():
+            self.parts[path]
+        for name in self._lazy:
+            if name not in skip:
+                getattr(self, name)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("KnowledgeBaseIndex snapshots are immutable")
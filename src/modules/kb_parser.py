@@ -0,0 +1,138 @@
+import re
+
+# Component section headers. The knowledge bases use "#<Name>", older tooling
+# expected "# <Name>", and a few sections were written as a bare "# ModusName".
+HEADER_PATTERN = re.compile(r"^#(?:\s*<\s*(?P<bracketed>[A-Za-z][\w-]*)\s*>|\s+(?P<bare>Modus\w*))\s*$")
+PROMPT_MARKER = "## Prompt"
+QUESTION_MARKER = "**User Question:**"
+ANSWER_MARKER = "**Agent Answer:**"
+FENCE = "```"
+
+
+def _finish_prompt(examples, lines, code_blocks):
+    """Turn the collected lines of one prompt into an example entry"""
+    text = "\n".join(lines)
+    question = ""
+    question_parts = text.split(QUESTION_MARKER, 1)
+    if len(question_parts) > 1:
+        question = question_parts[1].split(ANSWER_MARKER, 1)[0].strip()
+
+    examples.append({
+        "prompt_number": len(examples) + 1,
+        "question": question,
+        "code_blocks": code_blocks
+    })
+
+
+def parse_kb_content(content):
+    """Parse a markdown knowledge base into a structured example index in a single pass
+
+    Args:
+        content: The markdown text of the knowledge base
+
+    Returns:
+        tuple: (sections, issues) where sections maps component name -> list of
+            {"prompt_number", "question", "code_blocks"} with code_blocks mapping
+            fence language -> list of code strings, and issues lists
+            (line_number, header, message) for malformed or repeated headers
+    """
+    sections = {}
+    issues = []
+
+    examples = None
+    prompt_lines = None
+    code_blocks = None
+    fence_language = None
+    fence_lines = None
+
+    for line_number, line in enumerate(content.splitlines(), 1):
+        stripped = line.strip()
+
+        # Inside a code fence: collect until the closing fence
+        if fence_lines is not None:
+            if stripped.startswith(FENCE):
+                code_blocks.setdefault(fence_language, []).append("\n".join(fence_lines).strip())
+                fence_lines = None
+            else:
+                fence_lines.append(line)
+            if prompt_lines is not None:
+                prompt_lines.append(line)
+            continue
+
+        if line.startswith("#") and not line.startswith("##"):
+            match = HEADER_PATTERN.match(stripped)
+            if prompt_lines is not None:
+                _finish_prompt(examples, prompt_lines, code_blocks)
+                prompt_lines = None
+            if not match:
+                # Any other top-level heading closes the current component section
+                examples = None
+                continue
+
+            name = match.group("bracketed") or match.group("bare")
+            if match.group("bare"):
+                issues.append((line_number, stripped, f"expected '#<{name}>'"))
+            elif not stripped.startswith("#<"):
+                issues.append((line_number, stripped, f"expected '#<{name}>' without a space"))
+            # Repeated headers for the same component extend the existing section
+            if name in sections:
+                issues.append((line_number, stripped, f"repeated section, examples appended to the first '#<{name}>'"))
+            examples = sections.setdefault(name, [])
+            continue
+
+        if examples is None:
+            continue
+
+        if line.startswith(PROMPT_MARKER):
+            if prompt_lines is not None:
+                _finish_prompt(examples, prompt_lines, code_blocks)
+            prompt_lines = []
+            code_blocks = {}
+            continue
+
+        if prompt_lines is None:
+            continue
+
+        prompt_lines.append(line)
+        if stripped.startswith(FENCE):
+            fence_language = stripped[len(FENCE):].strip()
+            fence_lines = []
+
+    if fence_lines is not None:
+        issues.append((line_number, FENCE, "unterminated code fence at end of file"))
+    if prompt_lines is not None:
+        _finish_prompt(examples, prompt_lines, code_blocks)
+
+    return sections, issues
+
+
+def render_example(example, framework=None):
+    """Render a parsed example into the shape returned by the MCP tools
+
+    Args:
+        example: A parsed example from parse_kb_content
+        framework: 'angular' to join the HTML and TypeScript blocks, otherwise the
+            first tsx (or jsx) block is used
+
+    Returns:
+        dict: {"prompt_number", "question", "code"}
+    """
+    code_blocks = example["code_blocks"]
+    code = ""
+    if framework == "angular":
+        parts = []
+        if code_blocks.get("html"):
+            parts.append("/* HTML Template */\n" + code_blocks["html"][0])
+        if code_blocks.get("typescript"):
+            parts.append("/* TypeScript Component */\n" + code_blocks["typescript"][0])
+        code = "\n\n".join(parts)
+    else:
+        blocks = code_blocks.get("tsx") or code_blocks.get("jsx")
+        if blocks:
+            code = blocks[0]
+
+    return {
+        "prompt_number": example["prompt_number"],
+        "question": example["question"],
+        "code": code
+    }
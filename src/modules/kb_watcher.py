@@ -0,0 +1,116 @@
+import fnmatch
+import os
+import threading
+import time
+
+from modules.structured_log import get_logger
+
+logger = get_logger("watcher")
+
+class KnowledgeBaseWatcher:
+    """Polls the Knowledge Base directory and reports files whose content changed
+
+    Change detection uses (mtime_ns, size) signatures. A change is only reported once
+    the signature has been stable for one full poll interval, so editors that write a
+    file in several steps do not trigger a reload on a half-written file.
+    """
+
+    def __init__(self, directory, on_change, interval=2.0, patterns=("*.json", "*.md")):
+        """
+        Args:
+            directory: The directory to watch (not recursive)
+            on_change: Callable receiving a sorted list of changed file paths
+            interval: Seconds between polls
+            patterns: Filename glob patterns to watch
+        """
+        self.directory = directory
+        self.on_change = on_change
+        self.interval = interval
+        self.patterns = patterns
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._reported = self._scan()
+        self._previous = dict(self._reported)
+        self.last_change_at = None
+        self.last_changed_files = []
+
+    def _scan(self):
+        """Get the current signature of every watched file"""
+        signatures = {}
+        try:
+            names = os.listdir(self.directory)
+        except OSError as e:
+            logger.error("Error scanning knowledge base directory", path=self.directory, error=str(e))
+            return signatures
+
+        for name in names:
+            if not any(fnmatch.fnmatch(name, pattern) for pattern in self.patterns):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            signatures[path] = (stat.st_mtime_ns, stat.st_size)
+        return signatures
+
+    def poll(self):
+        """Run a single poll and notify on_change about files that settled on new content
+
+        Returns:
+            list: The changed file paths that were reported
+        """
+        current = self._scan()
+        changed = sorted(
+            path for path in set(current) | set(self._reported)
+            if current.get(path) != self._reported.get(path)
+            and current.get(path) == self._previous.get(path)
+        )
+        self._previous = current
+
+        if changed:
+            for path in changed:
+                if path in current:
+                    self._reported[path] = current[path]
+                else:
+                    self._reported.pop(path, None)
+            self.last_change_at = time.time()
+            self.last_changed_files = [os.path.basename(path) for path in changed]
+            try:
+                self.on_change(changed)
+            except Exception:
+                logger.exception("Error handling knowledge base change")
+        return changed
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            self.poll()
+
+    def start(self):
+        """Start polling in a background daemon thread"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="kb-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background polling thread"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def get_status(self):
+        """Get the watcher's configuration and most recent change"""
+        return {
+            "running": self.running,
+            "poll_interval_seconds": self.interval,
+            "watched_files": len(self._reported),
+            "last_change_at": self.last_change_at,
+            "last_changed_files": self.last_changed_files
+        }
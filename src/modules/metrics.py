@@ -0,0 +1,159 @@
+import bisect
+import functools
+import threading
+import time
+
+# Upper bounds (seconds) of the tool latency histogram buckets
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 3) if seconds is not None else None
+
+
+class Histogram:
+    """Fixed-bucket histogram with Prometheus-style upper bounds (not thread-safe)"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q):
+        """Estimate a quantile (0-1) by interpolating inside the bucket that holds it"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else self.max
+                # No observation exceeds max, so neither may the estimate
+                upper = min(upper, self.max)
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.max
+
+    def cumulative(self):
+        """Get (upper bound label, cumulative count) pairs ending with +Inf"""
+        total = 0
+        pairs = []
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            pairs.append((repr(bound), total))
+        pairs.append(("+Inf", self.count))
+        return pairs
+
+
+class ToolStats:
+    """Counters of one tool"""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.latency = Histogram()
+        self.response_bytes = 0
+        self.max_response_bytes = 0
+
+
+class ToolMetrics:
+    """Call count, error count, latency histogram and response size of every tool"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tools = {}
+        self.started_at = time.time()
+
+    def record(self, tool, seconds, response_bytes, error):
+        with self._lock:
+            stats = self._tools.get(tool)
+            if stats is None:
+                stats = self._tools[tool] = ToolStats()
+            stats.calls += 1
+            stats.errors += bool(error)
+            stats.latency.observe(seconds)
+            stats.response_bytes += response_bytes
+            stats.max_response_bytes = max(stats.max_response_bytes, response_bytes)
+
+    def instrument(self, measure, is_error):
+        """Decorator recording the metrics of an async tool function
+
+        The tool's result is returned unchanged. functools.wraps keeps the signature the
+        MCP layer derives the tool schema from.
+
+        Args:
+            measure: Callable giving the size in bytes of a result as sent to the client
+            is_error: Predicate telling whether a result is an error response
+        """
+        def decorator(fn):
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    result = await fn(*args, **kwargs)
+                except Exception:
+                    self.record(fn.__name__, time.perf_counter() - start, 0, True)
+                    raise
+                self.record(fn.__name__, time.perf_counter() - start, measure(result), is_error(result))
+                return result
+            return wrapper
+        return decorator
+
+    def get_stats(self):
+        """Get per-tool counters with estimated latency percentiles"""
+        with self._lock:
+            tools = {}
+            for tool, stats in sorted(self._tools.items()):
+                latency = stats.latency
+                tools[tool] = {
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "error_ratio": round(stats.errors / stats.calls, 4) if stats.calls else None,
+                    "latency_ms": {
+                        "p50": _ms(latency.quantile(0.5)),
+                        "p95": _ms(latency.quantile(0.95)),
+                        "p99": _ms(latency.quantile(0.99)),
+                        "mean": _ms(latency.sum / latency.count) if latency.count else None,
+                        "max": _ms(latency.max)
+                    },
+                    "response_bytes": {
+                        "total": stats.response_bytes,
+                        "mean": round(stats.response_bytes / stats.calls) if stats.calls else None,
+                        "max": stats.max_response_bytes
+                    }
+                }
+            return {"uptime_s": round(time.time() - self.started_at, 1), "tools": tools}
+
+    def prometheus_lines(self):
+        """Render the tool metrics in the Prometheus text exposition format"""
+        with self._lock:
+            tools = sorted(self._tools.items())
+            lines = []
+            for name, kind, help_text, value in (
+                ("modus_tool_calls_total", "counter", "Tool calls", lambda stats: stats.calls),
+                ("modus_tool_errors_total", "counter", "Tool calls that raised or returned success=false",
+                 lambda stats: stats.errors),
+                ("modus_tool_response_bytes_total", "counter", "Bytes of serialized tool responses",
+                 lambda stats: stats.response_bytes)
+            ):
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                lines.extend(f'{name}{{tool="{tool}"}} {value(stats)}' for tool, stats in tools)
+
+            lines.append("# HELP modus_tool_latency_seconds Tool call latency")
+            lines.append("# TYPE modus_tool_latency_seconds histogram")
+            for tool, stats in tools:
+                for bound, count in stats.latency.cumulative():
+                    lines.append(f'modus_tool_latency_seconds_bucket{{tool="{tool}",le="{bound}"}} {count}')
+                lines.append(f'modus_tool_latency_seconds_sum{{tool="{tool}"}} {stats.latency.sum}')
+                lines.append(f'modus_tool_latency_seconds_count{{tool="{tool}"}} {stats.latency.count}')
+        return lines
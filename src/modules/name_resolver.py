@@ -0,0 +1,84 @@
+import difflib
+import re
+
+# Names agents commonly use for Modus components; an alias is only added when its
+# target is a known component and the name does not already resolve to another one
+COMPONENT_ALIASES = {
+    "textbox": "ModusTextInput", "input": "ModusTextInput", "textfield": "ModusTextInput",
+    "textarea": "ModusTextareaInput", "multilineinput": "ModusTextareaInput",
+    "toggle": "ModusSwitch", "radio": "ModusRadioGroup", "radiobutton": "ModusRadioGroup",
+    "combobox": "ModusAutocomplete", "typeahead": "ModusAutocomplete",
+    "dropdownselect": "ModusSelect", "picklist": "ModusSelect",
+    "datefield": "ModusDateInput", "timefield": "ModusTimePicker", "numericinput": "ModusNumberInput",
+    "dialog": "ModusModal", "popup": "ModusModal", "snackbar": "ModusToast", "notification": "ModusToast",
+    "loader": "ModusSpinner", "progress": "ModusProgressBar", "datagrid": "ModusDataTable",
+    "tree": "ModusTreeView", "tag": "ModusChip", "pill": "ModusChip", "sidebar": "ModusSideNavigation",
+    "sidenav": "ModusSideNavigation", "fileupload": "ModusFileDropzone", "dropzone": "ModusFileDropzone",
+    "header": "ModusNavbar", "topbar": "ModusNavbar", "collapse": "ModusAccordion", "rating": "ModusSentimentScale"
+}
+
+PREFIX = "modus"
+
+_SEPARATORS = re.compile(r"[^a-z0-9]")
+
+
+def normalize_name(name):
+    """Lowercase a component name and drop separators, e.g. "modus-text-input" -> "modustextinput" """
+    return _SEPARATORS.sub("", name.lower())
+
+
+class ComponentNameResolver:
+    """Precomputed table resolving spellings of a component name to the registry name in O(1)
+
+    Every component resolves from its exact name, case- and separator-insensitively
+    ("ModusCheckBox", the Angular tag "modus-checkbox"), without the "Modus" prefix
+    ("checkbox", "CheckBox" as listed in List.txt) and from COMPONENT_ALIASES. The
+    table also records which knowledge base file holds each component's React examples.
+    """
+
+    def __init__(self, names, react_sources=None, aliases=COMPONENT_ALIASES):
+        """
+        Args:
+            names: Component names in precedence order; the first name claiming a
+                normalized spelling keeps it
+            react_sources: Component name -> path of the KB file with its React examples
+            aliases: Normalized alias -> component name
+        """
+        self._names = {}
+        self._keys = {}
+        for name in names:
+            if name in self._names:
+                continue
+            self._names[name] = name
+            key = normalize_name(name)
+            self._keys.setdefault(key, name)
+            if key.startswith(PREFIX) and len(key) > len(PREFIX):
+                self._keys.setdefault(key[len(PREFIX):], name)
+        for alias, name in aliases.items():
+            if name in self._names:
+                self._keys.setdefault(alias, name)
+        self._react_sources = dict(react_sources or {})
+
+    def resolve(self, name):
+        """Get the registry name for a spelling of a component name, or None if unknown"""
+        if name in self._names:
+            return name
+        return self._keys.get(normalize_name(name))
+
+    def suggest(self, name, limit=3):
+        """Get up to `limit` other component names close to a name, best match first"""
+        matches = difflib.get_close_matches(normalize_name(name), self._keys, n=limit * 3, cutoff=0.6)
+        suggestions = dict.fromkeys(self._keys[match] for match in matches)
+        suggestions.pop(self.resolve(name), None)
+        return list(suggestions)[:limit]
+
+    def react_source(self, name):
+        """Get the path of the KB file holding a component's React examples, or None"""
+        return self._react_sources.get(name)
+
+    def react_names(self):
+        """Get the names of the components that have React examples"""
+        return list(self._react_sources)
+
+    def __len__(self):
+        return len(self._names)
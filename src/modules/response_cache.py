@@ -0,0 +1,112 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+
+def content_etag(response):
+    """Content-addressed ETag of a JSON-serializable response
+
+    Identical content gets the same ETag in every knowledge base generation, so a
+    reload only changes the ETags of the responses whose content actually changed.
+    """
+    data = json.dumps(response, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()[:32]
+
+
+class ResponseCache:
+    """Cache of fully built tool responses keyed by (tool, normalized args, KB generation)
+
+    Responses of argument-less tools are pinned and never evicted. Responses of
+    parameterized tools live in a bounded LRU. Including the knowledge base generation
+    in every key means a hot reload invalidates everything at once; entries from older
+    generations are dropped as soon as a newer generation is seen.
+
+    Cached responses are shared between callers and must not be modified.
+    """
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._pinned = {}
+        self._entries = OrderedDict()
+        self._generation = None
+        self._hits = {}
+        self._misses = {}
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _check_generation(self, generation):
+        """Drop every entry when a newer knowledge base generation shows up (lock held)
+
+        Returns:
+            bool: False if the generation is older than the cached one
+        """
+        if self._generation is None or generation > self._generation:
+            if self._generation is not None:
+                self.invalidations += 1
+            self._generation = generation
+            self._pinned.clear()
+            self._entries.clear()
+        return generation == self._generation
+
+    def get(self, tool, args, generation):
+        """Get a cached response, or None (counted as a miss) if there is none"""
+        key = (tool, args)
+        with self._lock:
+            if not self._check_generation(generation):
+                self._misses[tool] = self._misses.get(tool, 0) + 1
+                return None
+            if key in self._pinned:
+                response = self._pinned[key]
+            elif key in self._entries:
+                self._entries.move_to_end(key)
+                response = self._entries[key]
+            else:
+                self._misses[tool] = self._misses.get(tool, 0) + 1
+                return None
+            self._hits[tool] = self._hits.get(tool, 0) + 1
+            return response
+
+    def put(self, tool, args, generation, response, pinned=False):
+        """Store a response built against the given knowledge base generation"""
+        key = (tool, args)
+        with self._lock:
+            # Responses built against a superseded generation are not stored
+            if not self._check_generation(generation):
+                return
+            if pinned:
+                self._pinned[key] = response
+                return
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._pinned.clear()
+            self._entries.clear()
+
+    def get_stats(self):
+        """Get hit/miss counters overall and per tool"""
+        with self._lock:
+            hits = sum(self._hits.values())
+            misses = sum(self._misses.values())
+            tools = sorted(set(self._hits) | set(self._misses))
+            return {
+                "generation": self._generation,
+                "entries": len(self._entries),
+                "pinned_entries": len(self._pinned),
+                "max_entries": self.max_entries,
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else None,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "per_tool": {
+                    tool: {"hits": self._hits.get(tool, 0), "misses": self._misses.get(tool, 0)}
+                    for tool in tools
+                }
+            }
@@ -0,0 +1,160 @@
+import heapq
+import math
+import re
+
+WORD_PATTERN = re.compile(r"[A-Za-z0-9]+")
+CAMEL_PATTERN = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+")
+STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "can", "do", "for", "from", "how",
+    "i", "in", "is", "it", "me", "my", "of", "on", "or", "show", "that", "the", "this",
+    "to", "use", "want", "what", "which", "with", "you"
+})
+SNIPPET_LENGTH = 200
+MEMBER_TYPES = {"properties": "property", "events": "event", "methods": "method"}
+
+
+def tokenize(text):
+    """Split text into lowercase search terms
+
+    camelCase and kebab-case identifiers are indexed both whole and by part, so
+    "headerText" matches "headertext", "header" and "text".
+    """
+    terms = []
+    for word in WORD_PATTERN.findall(text or ""):
+        lowered = word.lower()
+        if lowered not in STOPWORDS:
+            terms.append(lowered)
+        parts = CAMEL_PATTERN.findall(word)
+        if len(parts) > 1:
+            terms.extend(part.lower() for part in parts if part.lower() not in STOPWORDS)
+    return terms
+
+
+def _snippet(text):
+    text = " ".join((text or "").split())
+    if len(text) <= SNIPPET_LENGTH:
+        return text
+    return text[:SNIPPET_LENGTH].rsplit(" ", 1)[0] + "..."
+
+
+class SearchIndex:
+    """BM25-ranked inverted index over component metadata and KB examples
+
+    Each document is a component, one of its properties/events/methods, or one KB
+    prompt. Documents carry a pointer (what to fetch next) and a snippet.
+    """
+
+    def __init__(self, k1=1.5, b=0.75):
+        self.k1 = k1
+        self.b = b
+        self._documents = []
+        self._lengths = []
+        self._postings = {}
+        self._average_length = 0.0
+
+    def __len__(self):
+        return len(self._documents)
+
+    def add(self, pointer, text, boosted_text="", framework=None, snippet=None):
+        """Add a document to the index
+
+        Args:
+            pointer: dict describing the hit (type, component, name, ...)
+            text: Body text of the document
+            boosted_text: Identifier text counted twice (component/property names)
+            framework: 'react' or 'angular' for framework-specific documents, None otherwise
+            snippet: Text shown with the result, defaults to the start of the body text
+        """
+        terms = tokenize(boosted_text) * 2 + tokenize(text)
+        doc_id = len(self._documents)
+        self._documents.append((pointer, _snippet(text if snippet is None else snippet), framework))
+        self._lengths.append(len(terms))
+
+        frequencies = {}
+        for term in terms:
+            frequencies[term] = frequencies.get(term, 0) + 1
+        for term, frequency in frequencies.items():
+            self._postings.setdefault(term, []).append((doc_id, frequency))
+
+    def finalize(self):
+        """Compute collection statistics once all documents are added"""
+        self._average_length = (sum(self._lengths) / len(self._lengths)) if self._lengths else 0.0
+        self._postings = {term: tuple(postings) for term, postings in self._postings.items()}
+        return self
+
+    def search(self, query, framework=None, top_k=10):
+        """Rank documents against a query with BM25
+
+        Args:
+            query: Free-text query
+            framework: 'react' or 'angular' to drop the other framework's examples
+            top_k: Maximum number of results
+
+        Returns:
+            list: Result dicts (pointer fields plus "score" and "snippet"), best first
+        """
+        terms = set(tokenize(query))
+        if not terms or not self._documents or top_k <= 0:
+            return []
+
+        document_count = len(self._documents)
+        scores = {}
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (document_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, frequency in postings:
+                doc_framework = self._documents[doc_id][2]
+                if framework and doc_framework and doc_framework != framework:
+                    continue
+                norm = self.k1 * (1 - self.b + self.b * self._lengths[doc_id] / self._average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (self.k1 + 1) / (frequency + norm)
+
+        results = []
+        for doc_id, score in heapq.nlargest(top_k, scores.items(), key=lambda item: (item[1], -item[0])):
+            pointer, snippet, _ = self._documents[doc_id]
+            results.append({**pointer, "score": round(score, 3), "snippet": snippet})
+        return results
+
+
+def build_search_index(components, knowledge_bases):
+    """Build the full-text index from the component database and markdown KBs
+
+    Args:
+        components: Component name -> record mapping from the registry index
+        knowledge_bases: Iterable of (framework, source file name, MarkdownKnowledgeBase)
+
+    Returns:
+        SearchIndex: The finalized index
+    """
+    index = SearchIndex()
+    for name, component in components.items():
+        index.add({"type": "component", "component": name}, component["description"], boosted_text=name)
+        for kind, member_type in MEMBER_TYPES.items():
+            for member in component[kind]:
+                member_name = member.get("name", "")
+                text = " ".join(str(member.get(field, "")) for field in ("description", "type", "emits"))
+                options = member.get("options")
+                if options:
+                    text += " " + " ".join(str(option) for option in options)
+                index.add(
+                    {"type": member_type, "component": name, "name": member_name},
+                    text,
+                    boosted_text=member_name,
+                    snippet=member.get("description", "")
+                )
+
+    for framework, source, kb in knowledge_bases:
+        if kb is None:
+            continue
+        for name, examples in kb.sections.items():
+            for example in examples:
+                index.add(
+                    {"type": "example", "component": name, "framework": framework,
+                     "source": source, "prompt_number": example["prompt_number"]},
+                    example["question"],
+                    boosted_text=name,
+                    framework=framework
+                )
+    return index.finalize()
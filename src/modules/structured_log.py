@@ -0,0 +1,137 @@
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+ROOT_LOGGER = "modus"
+
+
+class StructuredFormatter(logging.Formatter):
+    """Formats records as one JSON object per line: time, level, logger, message and fields"""
+
+    def format(self, record):
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage()
+        }
+        entry.update(getattr(record, "fields", {}))
+        if getattr(record, "suppressed", 0):
+            entry["suppressed"] = record.suppressed
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """Formats records as readable lines with the fields appended as key=value pairs"""
+
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    def format(self, record):
+        line = super().format(record)
+        fields = dict(getattr(record, "fields", {}))
+        if getattr(record, "suppressed", 0):
+            fields["suppressed"] = record.suppressed
+        if fields:
+            line += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+        return line
+
+
+class RateLimitFilter(logging.Filter):
+    """Token bucket per message template so a hot code path cannot flood the log
+
+    Each distinct (logger, level, message) gets `burst` records up front, refilled at
+    `rate` records per second. Dropped records are counted and the count is attached
+    to the next record of the same message that gets through.
+    """
+
+    def __init__(self, rate=5.0, burst=20):
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self.dropped = 0
+
+    def filter(self, record):
+        key = (record.name, record.levelno, record.msg)
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated, suppressed = self._buckets.get(key, (self.burst, now, 0))
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+            if tokens < 1:
+                self._buckets[key] = (tokens, now, suppressed + 1)
+                self.dropped += 1
+                return False
+            self._buckets[key] = (tokens - 1, now, 0)
+        record.suppressed = suppressed
+        return True
+
+
+class StructuredLogger:
+    """Logger taking structured fields as keyword arguments
+
+    Records below the configured level are discarded before the message or the
+    fields are formatted, so debug logging on hot paths costs almost nothing.
+    """
+
+    def __init__(self, name):
+        self._logger = logging.getLogger(name)
+
+    def debug(self, msg, **fields):
+        self._log(logging.DEBUG, msg, fields)
+
+    def info(self, msg, **fields):
+        self._log(logging.INFO, msg, fields)
+
+    def warning(self, msg, **fields):
+        self._log(logging.WARNING, msg, fields)
+
+    def error(self, msg, **fields):
+        self._log(logging.ERROR, msg, fields)
+
+    def exception(self, msg, **fields):
+        self._log(logging.ERROR, msg, fields, exc_info=True)
+
+    def _log(self, level, msg, fields, exc_info=None):
+        if self._logger.isEnabledFor(level):
+            self._logger.log(level, msg, extra={"fields": fields}, exc_info=exc_info, stacklevel=3)
+
+
+def get_logger(name):
+    """Get a structured logger below the "modus" logger, e.g. get_logger("registry")"""
+    return StructuredLogger(f"{ROOT_LOGGER}.{name}")
+
+
+def configure_logging(level=None, log_format=None, rate=None, burst=None):
+    """Send the "modus" loggers to stderr with the given level, format and rate limit
+
+    Defaults come from MODUS_LOG_LEVEL (INFO), MODUS_LOG_FORMAT ("json" or "text",
+    default json), MODUS_LOG_RATE (records per second per message, default 5) and
+    MODUS_LOG_BURST (default 20).
+
+    Returns:
+        RateLimitFilter: The installed filter, whose `dropped` counter is reported in stats
+    """
+    level = level or os.environ.get("MODUS_LOG_LEVEL", "INFO")
+    log_format = log_format or os.environ.get("MODUS_LOG_FORMAT", "json")
+    rate_limit = RateLimitFilter(
+        rate=rate if rate is not None else float(os.environ.get("MODUS_LOG_RATE", "5")),
+        burst=burst if burst is not None else int(os.environ.get("MODUS_LOG_BURST", "20"))
+    )
+
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(StructuredFormatter() if log_format == "json" else TextFormatter())
+    handler.addFilter(rate_limit)
+
+    logger = logging.getLogger(ROOT_LOGGER)
+    logger.handlers[:] = [handler]
+    logger.setLevel(level.upper())
+    # FastMCP installs its own root handler; keep our records out of it
+    logger.propagate = False
+    return rate_limit
@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from modules.admission import AdmissionController, Overloaded, TokenBucket
+
+
+class Session:
+    """Stand-in for an MCP session (sessions key the rate limits weakly)"""
+
+
+async def _noop():
+    return "served"
+
+
+def test_token_bucket_allows_the_burst_then_reports_the_wait():
+    bucket = TokenBucket(rate=10, burst=2)
+
+    assert bucket.take() == 0 and bucket.take() == 0
+    assert 0 < bucket.take() <= 0.1
+
+
+def test_sessions_over_their_rate_are_shed():
+    admission = AdmissionController(rate=1, burst=2, max_in_flight=0)
+    session, other = Session(), Session()
+
+    async def scenario():
+        for _ in range(2):
+            assert await admission.run(session, _noop) == "served"
+        with pytest.raises(Overloaded) as shed:
+            await admission.run(session, _noop)
+        assert shed.value.reason == "rate_limited" and shed.value.retry_after > 0
+        # Every session has its own bucket, and internal calls are not rate limited
+        assert await admission.run(other, _noop) == "served"
+        for _ in range(5):
+            assert await admission.run(None, _noop) == "served"
+
+    asyncio.run(scenario())
+
+
+def test_requests_beyond_the_queue_are_shed():
+    admission = AdmissionController(rate=0, max_in_flight=1, max_queue=1, queue_timeout=0.05)
+
+    async def scenario():
+        release = asyncio.Event()
+        holder = asyncio.create_task(admission.run(None, release.wait))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(admission.run(None, _noop))
+        await asyncio.sleep(0)
+        assert admission.queued == 1
+
+        with pytest.raises(Overloaded) as shed:
+            await admission.run(None, _noop)
+        assert shed.value.reason == "queue_full"
+
+        with pytest.raises(Overloaded) as shed:
+            await waiter
+        assert shed.value.reason == "queue_timeout"
+
+        release.set()
+        await holder
+        assert await admission.run(None, _noop) == "served"
+
+    asyncio.run(scenario())
+
+
+def test_guard_turns_shed_requests_into_responses_and_counts_them():
+    admission = AdmissionController(rate=1, burst=1, max_in_flight=0)
+    session = Session()
+
+    @admission.guard(lambda: session, lambda error: {"success": False, "overloaded": error.reason})
+    async def tool():
+        return {"success": True}
+
+    async def scenario():
+        return [await tool(), await tool()]
+
+    assert asyncio.run(scenario()) == [{"success": True}, {"success": False, "overloaded": "rate_limited"}]
+    stats = admission.get_stats()
+    assert stats["admitted"] == 1
+    assert stats["shed"]["rate_limited"] == 1
+    assert stats["shed_by_tool"] == {"tool": 1}
@@ -0,0 +1,82 @@
+import pytest
+
+from modules.component_registry import ComponentRegistry, decode_example_cursor, encode_example_cursor
+
+REQUEST = {"component": "ModusSelect", "framework": "react", "max_examples": None, "include_code": True,
+           "include_questions": True}
+
+
+@pytest.fixture(scope="module")
+def registry():
+    return ComponentRegistry(use_artifact=False)
+
+
+def test_cursors_round_trip():
+    cursor = encode_example_cursor(3, 2, 2, REQUEST)
+
+    assert decode_example_cursor(cursor) == (3, 2, 2, REQUEST)
+
+
+@pytest.mark.parametrize("cursor", [
+    "not a cursor",
+    encode_example_cursor(1, -1, 2, REQUEST),
+    encode_example_cursor(1, 2, 0, REQUEST),
+    encode_example_cursor(1, 2, 2, {"component": "ModusSelect"})
+])
+def test_malformed_cursors_are_rejected(cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_example_cursor(cursor)
+
+
+def test_pages_add_up_to_the_unpaged_examples(registry):
+    expected = registry.get_component_details("ModusSelect", include_code=False)["examples"]
+
+    page = registry.get_component_details("select", page_size=2, include_code=False)
+    examples = page["examples"]
+    while page["next_cursor"]:
+        page = registry.get_component_details("ModusSelect", cursor=page["next_cursor"], include_code=False)
+        assert set(page) == {"component", "examples", "example_offset", "example_count", "next_cursor", "framework"}
+        examples += page["examples"]
+
+    assert len(expected) > 2
+    assert examples == expected
+
+
+@pytest.mark.parametrize("arguments, mismatch", [
+    ({"component_name": "ModusAutocomplete"}, "component='ModusSelect'"),
+    ({"component_name": "ModusSelect", "framework": "angular"}, "framework='react'"),
+    ({"component_name": "ModusSelect", "include_code": True}, "include_code=False"),
+    ({"component_name": "ModusSelect", "include_code": False, "max_examples": 2}, "max_examples=None")
+])
+def test_cursors_are_rejected_for_other_arguments(registry, arguments, mismatch):
+    cursor = registry.get_component_details("ModusSelect", page_size=1, include_code=False)["next_cursor"]
+
+    with pytest.raises(ValueError, match=mismatch):
+        registry.get_component_details(cursor=cursor, **{"include_code": False, **arguments})
+
+
+def test_cursors_from_another_generation_are_rejected(registry):
+    cursor = encode_example_cursor(registry.generation + 1, 1, 1, REQUEST)
+
+    with pytest.raises(ValueError, match="reloaded"):
+        registry.get_component_details("ModusSelect", cursor=cursor)
+
+
+@pytest.mark.parametrize("arguments, message", [
+    ({"page_size": 0}, "page_size must be at least 1, got 0"),
+    ({"max_examples": -1}, "max_examples must not be negative, got -1"),
+    ({"fields": ["props"]}, "Unknown fields: props"),
+    ({"output_format": "tiny"}, "Unknown format: tiny")
+])
+def test_invalid_arguments_are_rejected(registry, arguments, message):
+    with pytest.raises(ValueError, match=message):
+        registry.get_component_details("ModusSelect", **arguments)
+
+
+def test_spellings_of_a_component_are_resolved_once(registry):
+    names = registry.resolve_component_names(["checkbox", "ModusCheckbox", "modus-checkbox", "nope", "nope"])
+
+    assert names == ["ModusCheckbox", "nope"]
+    details = registry.get_components_details(["checkbox", "modus-checkbox", "nope"])
+    assert [component["component"] for component in details["components"]] == ["ModusCheckbox"]
+    assert details["not_found"] == ["nope"]
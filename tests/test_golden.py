@@ -0,0 +1,34 @@
+import os
+
+import pytest
+
+import golden
+from modules.component_registry import ComponentRegistry
+
+
+@pytest.fixture(scope="module")
+def live():
+    return ComponentRegistry(use_artifact=False)
+
+
+@pytest.fixture(scope="module")
+def cases(live):
+    return golden.build_cases(live.get_all_components())
+
+
+def test_parsed_index_matches_the_golden_outputs(live, cases):
+    outputs, _ = golden.run_path(golden.CurrentPath(live), cases, 1)
+    result = golden.compare("live", golden.read_golden(), outputs)
+
+    assert result["undocumented"] == []
+    assert result["identical"] == len(cases)
+
+
+def test_index_store_matches_the_golden_outputs(live, cases, tmp_path):
+    index_path = os.path.join(tmp_path, "modus_index.bin")
+    live.export_index_store(index_path)
+    outputs, _ = golden.run_path(golden.CurrentPath(ComponentRegistry(index_path=index_path)), cases, 1)
+    result = golden.compare("index_store", golden.read_golden(), outputs)
+
+    assert result["undocumented"] == []
+    assert result["identical"] == len(cases)
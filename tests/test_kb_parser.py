@@ -0,0 +1,72 @@
+from modules.kb_parser import parse_kb_content, render_example
+
+
+def _prompt(question, code, language="tsx"):
+    return (f"## Prompt\n**User Question:** {question}\n**Agent Answer:**\n"
+            f"```{language}\n{code}\n```\n")
+
+
+def test_bracketed_headers_open_sections():
+    sections, issues = parse_kb_content("#<ModusButton>\n" + _prompt("A button?", "<ModusButton />"))
+
+    assert list(sections) == ["ModusButton"]
+    assert sections["ModusButton"] == [{
+        "prompt_number": 1,
+        "question": "A button?",
+        "code_blocks": {"tsx": ["<ModusButton />"]}
+    }]
+    assert issues == []
+
+
+def test_spaced_and_bare_headers_are_parsed_and_reported():
+    content = ("# <ModusChip>\n" + _prompt("A chip?", "<ModusChip />")
+               + "# ModusRadioGroup\n" + _prompt("Radios?", "<ModusRadioGroup />"))
+    sections, issues = parse_kb_content(content)
+
+    assert list(sections) == ["ModusChip", "ModusRadioGroup"]
+    assert [(line, message) for line, _, message in issues] == [
+        (1, "expected '#<ModusChip>' without a space"),
+        (8, "expected '#<ModusRadioGroup>'")
+    ]
+
+
+def test_repeated_headers_extend_the_first_section():
+    content = ("#<ModusTable>\n" + _prompt("First?", "<A />")
+               + "#<ModusTable>\n" + _prompt("Second?", "<B />"))
+    sections, issues = parse_kb_content(content)
+
+    assert [example["question"] for example in sections["ModusTable"]] == ["First?", "Second?"]
+    assert [example["prompt_number"] for example in sections["ModusTable"]] == [1, 2]
+    assert issues == [(8, "#<ModusTable>", "repeated section, examples appended to the first '#<ModusTable>'")]
+
+
+def test_other_top_level_headings_close_the_section():
+    content = "#<ModusButton>\n" + _prompt("Kept?", "<A />") + "# Appendix\n" + _prompt("Dropped?", "<B />")
+    sections, _ = parse_kb_content(content)
+
+    assert [example["question"] for example in sections["ModusButton"]] == ["Kept?"]
+
+
+def test_headers_inside_code_fences_are_code():
+    sections, issues = parse_kb_content("#<ModusButton>\n" + _prompt("Markdown?", "#<NotASection>", "md"))
+
+    assert list(sections) == ["ModusButton"]
+    assert sections["ModusButton"][0]["code_blocks"] == {"md": ["#<NotASection>"]}
+    assert issues == []
+
+
+def test_unterminated_fences_are_reported():
+    _, issues = parse_kb_content("#<ModusButton>\n## Prompt\n```tsx\n<ModusButton />\n")
+
+    assert issues == [(4, "```", "unterminated code fence at end of file")]
+
+
+def test_render_example_picks_the_blocks_of_the_framework():
+    example = {"prompt_number": 1, "question": "Q", "code_blocks": {
+        "tsx": ["<A />"], "html": ["<a></a>"], "typescript": ["class A {}"]
+    }}
+
+    assert render_example(example)["code"] == "<A />"
+    assert render_example(example, "angular")["code"] == (
+        "/* HTML Template */\n<a></a>\n\n/* TypeScript Component */\nclass A {}"
+    )
@@ -0,0 +1,17 @@
+from modules.metrics import Histogram, ToolMetrics
+
+
+def test_quantiles_of_a_single_observation_do_not_exceed_it():
+    histogram = Histogram()
+    histogram.observe(0.012)
+
+    for q in (0.5, 0.95, 0.99):
+        assert histogram.quantile(q) <= histogram.max == 0.012
+
+
+def test_reported_percentiles_stay_below_max():
+    metrics = ToolMetrics()
+    metrics.record("get_component_details", 0.012, 100, False)
+
+    latency = metrics.get_stats()["tools"]["get_component_details"]["latency_ms"]
+    assert latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"] == 12.0
@@ -0,0 +1,47 @@
+from modules.name_resolver import ComponentNameResolver, normalize_name
+
+
+def test_normalize_name_drops_case_and_separators():
+    assert normalize_name("modus-text-input") == normalize_name("ModusTextInput") == "modustextinput"
+
+
+def test_spellings_resolve_to_the_registry_name():
+    resolver = ComponentNameResolver(["ModusCheckbox", "ModusTextInput"])
+
+    for spelling in ("ModusCheckbox", "ModusCheckBox", "modus-checkbox", "checkbox", "CheckBox"):
+        assert resolver.resolve(spelling) == "ModusCheckbox"
+    assert resolver.resolve("text-input") == "ModusTextInput"
+    assert resolver.resolve("checkboxes") is None
+
+
+def test_aliases_only_resolve_to_known_components():
+    resolver = ComponentNameResolver(["ModusTextInput"], aliases={"textbox": "ModusTextInput", "dialog": "ModusModal"})
+
+    assert resolver.resolve("TextBox") == "ModusTextInput"
+    assert resolver.resolve("dialog") is None
+
+
+def test_earlier_names_and_real_names_take_precedence():
+    resolver = ComponentNameResolver(["ModusTable", "Table", "ModusInput"], aliases={"input": "ModusTable"})
+
+    # "Table" and "ModusTable" both claim "table"; the first name listed keeps it
+    assert resolver.resolve("table") == "ModusTable"
+    assert resolver.resolve("Table") == "Table"
+    # An alias never takes over a spelling that already resolves
+    assert resolver.resolve("input") == "ModusInput"
+
+
+def test_suggestions_leave_out_the_name_itself():
+    resolver = ComponentNameResolver(["ModusButton", "ModusButtonGroup", "ModusCheckbox"])
+
+    assert resolver.suggest("buton")[0] == "ModusButton"
+    assert "ModusButton" not in resolver.suggest("ModusButton")
+
+
+def test_react_sources_are_kept_per_component():
+    resolver = ComponentNameResolver(["ModusButton"], react_sources={"ModusButton": "UI_KB.md"})
+
+    assert resolver.react_source("ModusButton") == "UI_KB.md"
+    assert resolver.react_source("ModusCheckbox") is None
+    assert resolver.react_names() == ["ModusButton"]
+    assert len(resolver) == 1